@@ -5,6 +5,7 @@ Enhanced base agent class with peer review capabilities.
 import os
 import json
 import time
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
@@ -225,7 +226,8 @@ class BaseAgentEnhanced(ABC):
             else:
                 api_params["max_tokens"] = getattr(self, 'max_tokens', 4000)
 
-            response = self.client.chat.completions.create(**api_params)
+            # The client is synchronous; run it off the event loop so concurrent tasks overlap
+            response = await asyncio.to_thread(self.client.chat.completions.create, **api_params)
 
             execution_time = time.time() - start_time
             response_content = response.choices[0].message.content
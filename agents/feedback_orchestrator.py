@@ -5,7 +5,9 @@ Feedback-aware orchestrator that manages peer review workflow.
 import os
 import sys
 import time
+import asyncio
 import logging
+from collections import Counter
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
@@ -173,7 +175,7 @@ class FeedbackOrchestrator:
 
         try:
             # Call the decomposer function
-            subtasks = decomposer.decompose_feature(task.description)
+            subtasks = await asyncio.to_thread(decomposer.decompose_feature, task.description)
             execution_time = time.time() - start_time
 
             # Format the decomposition content
@@ -244,43 +246,32 @@ class FeedbackOrchestrator:
     
     def _generate_feedback_summary(self, task_id: str) -> Dict[str, Any]:
         """Generate summary of feedback for this task"""
-        task_feedback = [
-            entry for entry in self.feedback_tracker.feedback_log 
-            if entry.task_id == task_id
-        ]
+        feedback_by_agent: Dict[str, List[Dict[str, Any]]] = {}
+        issue_counts = Counter()
+        total = retry_total = retry_success = 0
+        
+        # Single pass over this task's entries, accumulating every summary field at once
+        for entry in self.feedback_tracker.get_task_feedback(task_id):
+            total += 1
+            feedback_by_agent.setdefault(entry.to_agent, []).append({
+                'from': entry.from_agent,
+                'feedback': entry.feedback[:100] + '...' if len(entry.feedback) > 100 else entry.feedback,
+                'confidence': entry.validation_confidence,
+                'retry_successful': entry.retry_successful
+            })
+            issue_counts.update(entry.issues)
+            if entry.retry_successful is not None:
+                retry_total += 1
+                retry_success += entry.retry_successful
         
         summary = {
-            'total_feedback_instances': len(task_feedback),
-            'feedback_by_agent': {},
-            'common_issues': [],
-            'retry_success_rate': 0.0
+            'total_feedback_instances': total,
+            'feedback_by_agent': feedback_by_agent,
+            # Most frequent first
+            'common_issues': [issue for issue, _ in issue_counts.most_common()],
+            'retry_success_rate': retry_success / retry_total if retry_total else 0.0
         }
         
-        if task_feedback:
-            # Group by receiving agent
-            for entry in task_feedback:
-                agent = entry.to_agent
-                if agent not in summary['feedback_by_agent']:
-                    summary['feedback_by_agent'][agent] = []
-                summary['feedback_by_agent'][agent].append({
-                    'from': entry.from_agent,
-                    'feedback': entry.feedback[:100] + '...' if len(entry.feedback) > 100 else entry.feedback,
-                    'confidence': entry.validation_confidence,
-                    'retry_successful': entry.retry_successful
-                })
-            
-            # Calculate retry success rate
-            retries_with_outcome = [e for e in task_feedback if e.retry_successful is not None]
-            if retries_with_outcome:
-                successful_retries = sum(1 for e in retries_with_outcome if e.retry_successful)
-                summary['retry_success_rate'] = successful_retries / len(retries_with_outcome)
-            
-            # Collect common issues
-            all_issues = []
-            for entry in task_feedback:
-                all_issues.extend(entry.issues)
-            summary['common_issues'] = list(set(all_issues))
-        
         return summary
     
     def _extract_quality_score(self, quality_output: str) -> float:
@@ -1,6 +1,7 @@
 import os
 import json
 import logging
+import signal
 import subprocess
 import sys
 import threading
@@ -24,6 +25,10 @@ class OrchestratorAgent:
     implementation, testing, and quality assessment.
     """
     
+    # Shared task/project state is guarded by tasks_lock, so distinct tasks
+    # may be processed from several threads at once.
+    supports_concurrent_processing = True
+    
     def __init__(self, base_path: str):
         """
         Initialize the orchestrator with configuration and directory settings.
@@ -438,9 +443,14 @@ class OrchestratorAgent:
             elif task.status == TaskStatus.READY_FOR_INTEGRATION:
                 # For tasks with subtasks, check if all subtasks are completed
                 if task.subtask_ids:
+                    # Snapshot under the lock; other workers add tasks concurrently
+                    with self.tasks_lock:
+                        subtask_statuses = [
+                            self.tasks[subtask_id].status
+                            for subtask_id in task.subtask_ids
+                        ]
                     all_subtasks_completed = all(
-                        self.tasks[subtask_id].status == TaskStatus.COMPLETED
-                        for subtask_id in task.subtask_ids
+                        status == TaskStatus.COMPLETED for status in subtask_statuses
                     )
                     if not all_subtasks_completed:
                         self.logger.info(f"Task {task_id} waiting for subtasks to complete")
@@ -480,22 +490,25 @@ class OrchestratorAgent:
         if not project.root_tasks:
             return
             
-        # Check status of all root tasks
-        root_task_statuses = [
-            self.tasks[task_id].status
-            for task_id in project.root_tasks
-            if task_id in self.tasks
-        ]
-        
-        # Update project status
-        if all(status == TaskStatus.COMPLETED for status in root_task_statuses):
-            project.status = ProjectStatus.COMPLETED
-        elif any(status == TaskStatus.ERROR for status in root_task_statuses):
-            project.status = ProjectStatus.ERROR
-        else:
-            project.status = ProjectStatus.ACTIVE
-        
-        project.save()
+        # create_task adds tasks and saves projects under tasks_lock from
+        # other workers, so read the statuses and save under it too
+        with self.tasks_lock:
+            # Check status of all root tasks
+            root_task_statuses = [
+                self.tasks[task_id].status
+                for task_id in project.root_tasks
+                if task_id in self.tasks
+            ]
+            
+            # Update project status
+            if all(status == TaskStatus.COMPLETED for status in root_task_statuses):
+                project.status = ProjectStatus.COMPLETED
+            elif any(status == TaskStatus.ERROR for status in root_task_statuses):
+                project.status = ProjectStatus.ERROR
+            else:
+                project.status = ProjectStatus.ACTIVE
+            
+            project.save()
         self.logger.info(f"Updated project {project.project_id} status to {project.status.value}")
     
     def get_all_tasks(self) -> List[Dict]:
@@ -633,23 +646,24 @@ class OrchestratorAgent:
         task.project_id = project_id
         task.parent_task_id = parent_task_id
         
-        # Update parent task if this is a subtask
-        if parent_task_id:
-            if parent_task_id not in self.tasks:
-                raise ValueError(f"Parent task {parent_task_id} not found")
-            parent_task = self.tasks[parent_task_id]
-            parent_task.subtask_ids.append(task.task_id)
-            self._save_task(parent_task)
-        
-        self.tasks[task.task_id] = task
-        self._save_task(task)
-        
-        # Update project
-        project = self.projects[project_id]
-        if not parent_task_id:  # Only add to root_tasks if not a subtask
-            project.root_tasks.append(task.task_id)
-        project.all_tasks.append(task.task_id)
-        project.save()
+        with self.tasks_lock:
+            # Update parent task if this is a subtask
+            if parent_task_id:
+                if parent_task_id not in self.tasks:
+                    raise ValueError(f"Parent task {parent_task_id} not found")
+                parent_task = self.tasks[parent_task_id]
+                parent_task.subtask_ids.append(task.task_id)
+                self._save_task(parent_task)
+            
+            self.tasks[task.task_id] = task
+            self._save_task(task)
+            
+            # Update project
+            project = self.projects[project_id]
+            if not parent_task_id:  # Only add to root_tasks if not a subtask
+                project.root_tasks.append(task.task_id)
+            project.all_tasks.append(task.task_id)
+            project.save()
         
         self.logger.info(f"Created task {task.task_id} in project {project_id}")
         return task
@@ -691,12 +705,12 @@ def main():
     orchestrator = OrchestratorAgent()
     orchestrator.start()
     
-    try:
-        # Keep the main thread running
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        orchestrator.stop()
+    # Block the main thread until SIGINT/SIGTERM instead of polling
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    stop_event.wait()
+    orchestrator.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,7 +4,44 @@ Utility functions for handling JSON files.
 
 import json
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+def dumps_bytes(data: Any, indent: bool = False, default: Optional[Callable] = None) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON, using orjson when it is installed.
+    
+    Args:
+        data (Any): Data to serialize
+        indent (bool, optional): Indent output by two spaces. Defaults to False.
+        default (Callable, optional): Serializer for unsupported types. Defaults to None.
+        
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, default=default).encode()
+
+def loads_bytes(data: bytes) -> Any:
+    """
+    Parse a JSON document from bytes, a memoryview or str, using orjson when it is installed.
+    
+    Args:
+        data (bytes): Encoded JSON document
+        
+    Returns:
+        Any: Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
 
 def load_json(file_path: str) -> Optional[Dict[str, Any]]:
     """
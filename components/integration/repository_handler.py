@@ -4,9 +4,20 @@ Repository handler for managing Git operations during integration.
 
 import os
 import git
+import time
+import hashlib
 import logging
+import functools
+import itertools
 from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+
+# Source of placeholder commit IDs until real commits are wired in
+_commit_seq = itertools.count(int(time.time()))
+
+@functools.lru_cache(maxsize=1024)
+def _branch_name(task_id: str) -> str:
+    """Build the integration branch name for a task ID."""
+    return f"integration/{task_id.lower()}"
 
 class RepositoryHandler:
     """Handles Git repository operations for code integration."""
@@ -20,11 +31,100 @@ class RepositoryHandler:
         """
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
+        
+        # Opening a repository and resolving HEAD are expensive, so both are
+        # cached per repository directory for the lifetime of the handler.
+        self._repos: Dict[str, git.Repo] = {}
+        self._head_sha_cache: Dict[str, Tuple[float, float, str]] = {}
+        self._head_sha_ttl = float(self.config.get("head_sha_ttl", 5.0))
+    
+    def _repo(self, repo_dir: str) -> git.Repo:
+        """
+        Get a cached repository handle for the directory.
+        
+        Args:
+            repo_dir (str): Repository directory
+            
+        Returns:
+            git.Repo: Repository handle
+        """
+        repo = self._repos.get(repo_dir)
+        if repo is None:
+            repo = self._repos[repo_dir] = git.Repo(repo_dir)
+        return repo
+    
+    def _head_sha(self, repo_dir: str) -> str:
+        """
+        Get the HEAD commit SHA, reusing the cached value while `.git/HEAD`
+        is unchanged and the cache entry is younger than the configured TTL.
+        
+        Args:
+            repo_dir (str): Repository directory
+            
+        Returns:
+            str: HEAD commit SHA
+        """
+        mtime = os.stat(os.path.join(repo_dir, ".git", "HEAD")).st_mtime
+        now = time.monotonic()
+        cached = self._head_sha_cache.get(repo_dir)
+        if cached and cached[0] == mtime and now - cached[1] < self._head_sha_ttl:
+            return cached[2]
+        
+        sha = self._repo(repo_dir).head.commit.hexsha
+        self._head_sha_cache[repo_dir] = (mtime, now, sha)
+        return sha
+    
+    def _invalidate_head_sha(self, repo_dir: str):
+        """
+        Drop the cached HEAD SHA after an operation that moves HEAD.
+        
+        Args:
+            repo_dir (str): Repository directory
+        """
+        self._head_sha_cache.pop(repo_dir, None)
+    
+    def _ensure_mirror(self, url: str) -> str:
+        """
+        Create or refresh a local bare mirror of the remote repository.
+        
+        Mirrors live under `mirror_dir` (default
+        `~/.cache/coding-agent/mirrors`) and are fetched again once they are
+        older than `mirror_ttl` seconds.
+        
+        Args:
+            url (str): Remote repository URL
+            
+        Returns:
+            str: Path to the mirror
+        """
+        mirror_root = os.path.expanduser(
+            self.config.get("mirror_dir", "~/.cache/coding-agent/mirrors")
+        )
+        slug = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        mirror_dir = os.path.join(mirror_root, f"{slug}.git")
+        
+        if not os.path.isdir(mirror_dir):
+            os.makedirs(mirror_root, exist_ok=True)
+            self.logger.info(f"Creating repository mirror for {url} at {mirror_dir}")
+            git.Repo.clone_from(url, mirror_dir, bare=True, mirror=True)
+        elif time.time() - os.path.getmtime(mirror_dir) > self.config.get("mirror_ttl", 300):
+            self.logger.info(f"Refreshing repository mirror at {mirror_dir}")
+            git.Repo(mirror_dir).remotes.origin.fetch(prune=True)
+            # Fetching does not always touch the directory itself
+            os.utime(mirror_dir)
+        
+        return mirror_dir
     
     def clone_repository(self, target_dir: str) -> Tuple[bool, str]:
         """
         Clone the repository to the target directory.
         
+        The clone is shallow (`depth`, default 1) and blob-filtered, and can
+        be narrowed further with `sparse_paths` or seeded from a local
+        `reference` repository so repeated clones avoid the network. When no
+        reference is given, a local bare mirror is maintained and used as
+        the reference unless `use_mirror` is disabled.
+        
         Args:
             target_dir (str): Directory to clone into
             
@@ -32,9 +132,36 @@ class RepositoryHandler:
             Tuple[bool, str]: Success status and message/error
         """
         try:
-            # For now, just create the directory as we don't have a real repo
-            os.makedirs(target_dir, exist_ok=True)
-            return True, "Repository initialized successfully"
+            url = self.config.get("url")
+            if not url:
+                # No remote configured, just create an empty working directory
+                os.makedirs(target_dir, exist_ok=True)
+                return True, "Repository initialized successfully"
+            
+            sparse_paths = self.config.get("sparse_paths") or []
+            multi_options = ["--filter=blob:none", "--no-tags"]
+            if sparse_paths:
+                multi_options.append("--sparse")
+            reference = self.config.get("reference")
+            if not reference and self.config.get("use_mirror", True):
+                try:
+                    reference = self._ensure_mirror(url)
+                except Exception as e:
+                    self.logger.warning(f"Repository mirror unavailable, cloning from remote: {str(e)}")
+            if reference:
+                multi_options.extend([f"--reference={reference}", "--dissociate"])
+            
+            repo = git.Repo.clone_from(
+                url,
+                target_dir,
+                depth=self.config.get("depth", 1),
+                multi_options=multi_options
+            )
+            if sparse_paths:
+                repo.git.sparse_checkout("set", *sparse_paths)
+            
+            self._repos[target_dir] = repo
+            return True, "Repository cloned successfully"
         except Exception as e:
             return False, str(e)
     
@@ -51,7 +178,7 @@ class RepositoryHandler:
             Tuple[bool, str]: Success status and branch name/error
         """
         try:
-            branch_name = f"integration/{task_id.lower()}"
+            branch_name = _branch_name(task_id)
             # For now, just return success as we don't have a real repo
             return True, branch_name
         except Exception as e:
@@ -85,12 +212,20 @@ class RepositoryHandler:
             Tuple[bool, str]: Success status and message/error
         """
         try:
-            # Write files to the repository
-            for file_info in files:
-                file_path = os.path.join(repo_dir, file_info["path"])
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            # Write files to the repository, grouped by directory so each
+            # directory is created only once
+            paths = [(os.path.join(repo_dir, f["path"]), f["content"]) for f in files]
+            paths.sort(key=lambda p: os.path.dirname(p[0]))
+            
+            current_dir = None
+            for file_path, content in paths:
+                file_dir = os.path.dirname(file_path)
+                if file_dir != current_dir:
+                    os.makedirs(file_dir, exist_ok=True)
+                    current_dir = file_dir
                 with open(file_path, "w") as f:
-                    f.write(file_info["content"])
+                    f.write(content)
+            self._invalidate_head_sha(repo_dir)
             return True, "Changes merged successfully"
         except Exception as e:
             return False, str(e)
@@ -108,7 +243,8 @@ class RepositoryHandler:
         """
         try:
             # For now, just generate a fake commit ID
-            commit_id = datetime.now().strftime("%Y%m%d%H%M%S")
+            commit_id = f"{next(_commit_seq):x}"
+            self._invalidate_head_sha(repo_dir)
             return True, commit_id
         except Exception as e:
             return False, str(e)
@@ -4,8 +4,11 @@ Main entry point for the AI-Driven Development Workflow System.
 
 import os
 import sys
+import atexit
 import logging
+import logging.handlers
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 from pathlib import Path
 
@@ -29,11 +32,23 @@ def load_environment():
 
 def setup_logging():
     """Set up logging configuration"""
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    
+    # Buffer file records and write them in batches; errors flush immediately
+    file_handler = logging.FileHandler('logs/main.log')
+    file_handler.setFormatter(logging.Formatter(log_format))
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    atexit.register(buffered_handler.flush)
+    
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
-            logging.FileHandler('logs/main.log'),
+            buffered_handler,
             logging.StreamHandler(sys.stdout)
         ]
     )
@@ -161,8 +176,31 @@ def delete_task(orchestrator: OrchestratorAgent, task_id: str) -> bool:
         logger.error(f"Failed to delete task {task_id}")
     return success
 
-def main():
-    """Main entry point"""
+def process_tasks(orchestrator: OrchestratorAgent, task_ids: list):
+    """
+    Process tasks, concurrently when the orchestrator supports it.
+    
+    Args:
+        orchestrator (OrchestratorAgent): The orchestrator agent
+        task_ids (list): IDs of the tasks to process
+    """
+    max_workers = int(os.getenv("AGENT_CONCURRENCY", "8"))
+    if max_workers <= 1 or not getattr(orchestrator, "supports_concurrent_processing", False):
+        for task_id in task_ids:
+            logger.info(f"Processing task {task_id}")
+            orchestrator.process_task(task_id)
+        return
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for task_id in task_ids:
+            logger.info(f"Processing task {task_id}")
+            futures.append(executor.submit(orchestrator.process_task, task_id))
+        for future in as_completed(futures):
+            future.result()
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser"""
     parser = argparse.ArgumentParser(description="AI-Driven Development Workflow System")
     
     # Project commands
@@ -197,7 +235,13 @@ def main():
     parser.add_argument('--task-id',
                        help='ID of the task to delete')
     
-    args = parser.parse_args()
+    return parser
+
+_PARSER = _build_parser()
+
+def main():
+    """Main entry point"""
+    args = _PARSER.parse_args()
     
     # Load environment variables first
     load_environment()
@@ -258,11 +302,12 @@ def main():
                 sys.exit(1)
         
         else:
-            # Process existing tasks
-            for task_id, task in orchestrator.tasks.items():
-                if task.status not in [TaskStatus.COMPLETED, TaskStatus.ERROR]:
-                    logger.info(f"Processing task {task_id}")
-                    orchestrator.process_task(task_id)
+            # Process existing tasks (snapshot first, decomposition adds subtasks)
+            task_ids = [
+                task_id for task_id, task in list(orchestrator.tasks.items())
+                if task.status not in [TaskStatus.COMPLETED, TaskStatus.ERROR]
+            ]
+            process_tasks(orchestrator, task_ids)
         
         logger.info("AI-Driven Development Workflow System completed successfully")
         
@@ -8,19 +8,13 @@ import sys
 import asyncio
 import argparse
 import logging
-from datetime import datetime
-from dotenv import load_dotenv
 
 # Add project root to Python path
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
-from models.task import Task, TaskStatus
-from agents.feedback_orchestrator import FeedbackOrchestrator
-from models.validation import FeedbackTracker
-
-# Load environment variables
-load_dotenv()
+# Agent and model modules are imported where needed, so --help and
+# --stats don't pay for loading the whole agent stack
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -29,6 +23,8 @@ logger = logging.getLogger(__name__)
 async def process_task_with_peer_review(task_description: str, project_id: str = "DEFAULT", 
                                       language: str = "python", priority: int = 80) -> dict:
     """Process a task using the peer review system"""
+    from models.task import Task
+    from agents.feedback_orchestrator import FeedbackOrchestrator
     
     # Create task
     task = Task(
@@ -69,6 +65,8 @@ async def process_task_with_peer_review(task_description: str, project_id: str =
 
 def show_feedback_stats():
     """Show current feedback statistics"""
+    from models.validation import FeedbackTracker
+    
     logger.info("📊 Current Feedback Statistics")
     
     tracker = FeedbackTracker()
@@ -142,9 +140,12 @@ async def main():
         logger.info("🎯 Peer Review System - Interactive Mode")
         logger.info("Enter task descriptions (or 'quit' to exit, 'stats' for statistics)")
         
+        # Read input on a worker thread so background tasks keep running
+        loop = asyncio.get_running_loop()
+        
         while True:
             try:
-                task_input = input("\n📝 Task: ").strip()
+                task_input = (await loop.run_in_executor(None, input, "\n📝 Task: ")).strip()
                 
                 if task_input.lower() in ['quit', 'exit', 'q']:
                     break
@@ -161,7 +162,7 @@ async def main():
                 else:
                     print(f"\n❌ Task failed: {result.get('error', 'Unknown error')}")
                 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 break
             except Exception as e:
                 logger.error(f"Error: {str(e)}")
@@ -169,4 +170,9 @@ async def main():
     logger.info("👋 Goodbye!")
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+    
+    # Load environment variables
+    load_dotenv()
+    
     asyncio.run(main())
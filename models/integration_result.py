@@ -2,12 +2,32 @@
 Model for tracking integration results.
 """
 
+import time
 from typing import Dict, List, Optional
 from datetime import datetime
 
+# Issue timestamps are truncated to whole seconds so the formatted value can
+# be reused for every issue recorded within the same second. The (second, iso)
+# pair is replaced in one assignment so threads never see a mismatched pair.
+_issue_clock = (0, "")
+
+def _issue_timestamp() -> str:
+    """Get the current time, truncated to the second, as an ISO string"""
+    global _issue_clock
+    second = int(time.time())
+    clock = _issue_clock
+    if second != clock[0]:
+        clock = _issue_clock = (second, datetime.fromtimestamp(second).isoformat())
+    return clock[1]
+
 class IntegrationResult:
     """Represents the result of an integration process."""
     
+    __slots__ = (
+        "task_id", "status", "start_time", "start_time_iso", "end_time",
+        "end_time_iso", "integration_branch", "commit_id", "issues"
+    )
+    
     def __init__(self, task_id: str):
         """
         Initialize integration result.
@@ -18,7 +38,9 @@ class IntegrationResult:
         self.task_id = task_id
         self.status = "pending"
         self.start_time = datetime.now()
+        self.start_time_iso = self.start_time.isoformat()
         self.end_time = None
+        self.end_time_iso = None
         self.integration_branch = None
         self.commit_id = None
         self.issues = []
@@ -33,6 +55,7 @@ class IntegrationResult:
         self.status = status
         if status in ["success", "failure"]:
             self.end_time = datetime.now()
+            self.end_time_iso = self.end_time.isoformat()
     
     def set_integration_details(self, integration_branch: Optional[str] = None, commit_id: Optional[str] = None):
         """
@@ -62,7 +85,7 @@ class IntegrationResult:
             "file": file_path,
             "message": message,
             "resolution": resolution,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _issue_timestamp()
         })
     
     def to_dict(self) -> Dict:
@@ -75,8 +98,8 @@ class IntegrationResult:
         return {
             "task_id": self.task_id,
             "status": self.status,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "start_time": self.start_time_iso,
+            "end_time": self.end_time_iso,
             "integration_branch": self.integration_branch,
             "commit_id": self.commit_id,
             "issues": self.issues
@@ -96,7 +119,9 @@ class IntegrationResult:
         result = cls(data["task_id"])
         result.status = data["status"]
         result.start_time = datetime.fromisoformat(data["start_time"])
+        result.start_time_iso = data["start_time"]
         result.end_time = datetime.fromisoformat(data["end_time"]) if data["end_time"] else None
+        result.end_time_iso = data["end_time"]
         result.integration_branch = data["integration_branch"]
         result.commit_id = data["commit_id"]
         result.issues = data["issues"]
@@ -5,9 +5,12 @@ Project model for managing collections of related tasks.
 from enum import Enum
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+from collections import defaultdict
 import uuid
 import os
-import json
+import asyncio
+import aiofiles
+from common.json_utils import dumps_bytes, loads_bytes
 from .task import Task, TaskStatus
 
 class ProjectStatus(Enum):
@@ -19,11 +22,32 @@ class ProjectStatus(Enum):
     ARCHIVED = "archived"
     FAILED = "failed"
 
+async def _read_task(task_path: str) -> Task:
+    """Read and parse a single task file"""
+    async with aiofiles.open(task_path, 'rb') as f:
+        return Task.from_dict(loads_bytes(await f.read()))
+
 class Project:
     """
     Represents a development project that contains multiple related tasks.
+    
+    Modifications are written to disk when each public method returns. Use
+    the project as a context manager to batch many modifications into a
+    single write of every touched file:
+    
+        with project:
+            for task in tasks:
+                project.add_task(task)
     """
     
+    __slots__ = (
+        "project_id", "name", "description", "root_tasks", "all_tasks", "tasks",
+        "status", "created_at", "updated_at", "base_path",
+        "_dirty_tasks", "_dirty_project", "_batch_depth",
+        "_root_ids", "_root_count", "_root_completed", "_root_failed",
+        "_ensured_dirs", "_children", "_pending"
+    )
+    
     def __init__(self, name: str, description: str, base_path: str = "projects"):
         """
         Initialize a new project.
@@ -33,32 +57,65 @@ class Project:
             description (str): Project description
             base_path (str): Base directory for project files
         """
-        self.project_id = f"PROJ-{str(uuid.uuid4())[:8]}"
+        self.project_id = "PROJ-" + uuid.uuid4().hex[:8]
         self.name = name
         self.description = description
         self.root_tasks = []  # Top-level task IDs
         self.all_tasks = []  # List of all task IDs
         self.tasks = {}  # Map of task_id to Task objects
+        self._children: Dict[str, List[Task]] = defaultdict(list)  # Parent task ID to subtasks
+        self._pending: Dict[str, int] = {}  # Parent task ID to number of unfinished subtasks
         self.status = ProjectStatus.CREATED
         self.created_at = datetime.now().isoformat()
         self.updated_at = self.created_at
         self.base_path = base_path
-        self.project_path = os.path.join(base_path, self.project_id)
-        
-        # Create project directory structure
-        self._create_directory_structure()
-        
-    def _create_directory_structure(self):
-        """Create the project's directory structure"""
-        dirs = [
-            self.project_path,
-            os.path.join(self.project_path, "tasks"),
-            os.path.join(self.project_path, "implementations"),
-            os.path.join(self.project_path, "tests"),
-            os.path.join(self.project_path, "docs")
-        ]
-        for dir_path in dirs:
+        
+        # Pending writes, flushed at the end of each public call or batch
+        self._dirty_tasks: Dict[str, Task] = {}
+        self._dirty_project = False
+        self._batch_depth = 0
+        
+        # Counters over loaded root tasks, kept in step with status changes
+        self._root_ids = set()
+        self._root_count = 0
+        self._root_completed = 0
+        self._root_failed = 0
+        
+        # Project directories are created lazily on first write
+        self._ensured_dirs = set()
+        
+    @property
+    def project_path(self) -> str:
+        """Directory holding this project's files"""
+        return os.path.join(self.base_path, self.project_id)
+        
+    def __enter__(self) -> 'Project':
+        """Start a batch of modifications that is written to disk once on exit"""
+        self._batch_depth += 1
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """End a batch of modifications and flush pending writes"""
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+        
+    def _ensure_subdir(self, name: str = "") -> str:
+        """
+        Create a project subdirectory (or the project root) on first use.
+        
+        Args:
+            name (str): Subdirectory name, e.g. "tasks", "implementations",
+                "tests" or "docs". Defaults to the project root.
+                
+        Returns:
+            str: Path to the directory
+        """
+        dir_path = os.path.join(self.project_path, name) if name else self.project_path
+        if dir_path not in self._ensured_dirs:
             os.makedirs(dir_path, exist_ok=True)
+            self._ensured_dirs.add(dir_path)
+        return dir_path
             
     def add_task(self, task: Task, parent_task_id: Optional[str] = None) -> None:
         """
@@ -77,14 +134,21 @@ class Project:
             parent_task = self.tasks[parent_task_id]
             task.parent_task_id = parent_task_id
             parent_task.subtask_ids.append(task.task_id)
+            self._children[parent_task_id].append(task)
+            pending = self._pending.get(parent_task_id, 0)
+            self._pending[parent_task_id] = pending + (task.status != TaskStatus.COMPLETED)
             self._save_task(parent_task)
         else:
             self.root_tasks.append(task.task_id)
+            self._root_ids.add(task.task_id)
+            self._count_root_status(task.status, 1)
+            self._root_count += 1
             
         self.tasks[task.task_id] = task
         self.all_tasks.append(task.task_id)
         self._save_task(task)
         self._save_project_state()
+        self._flush_unless_batched()
         
     def get_task(self, task_id: str) -> Optional[Task]:
         """
@@ -108,11 +172,7 @@ class Project:
         Returns:
             List[Task]: List of subtask objects
         """
-        task = self.get_task(task_id)
-        if not task:
-            return []
-            
-        return [self.tasks[subtask_id] for subtask_id in task.subtask_ids]
+        return list(self._children.get(task_id, ()))
         
     def update_task_status(self, task_id: str, status: TaskStatus, message: str = None) -> None:
         """
@@ -127,8 +187,7 @@ class Project:
         if not task:
             raise ValueError(f"Task {task_id} not found")
             
-        task.update_status(status, message)
-        self._save_task(task)
+        self._set_task_status(task, status, message)
         
         # If task is completed, check if parent task can be updated
         if status == TaskStatus.COMPLETED and task.parent_task_id:
@@ -136,36 +195,79 @@ class Project:
             
         # Update project status based on root tasks
         self._update_project_status()
+        self._flush_unless_batched()
         
     def _check_parent_task_completion(self, parent_task_id: str) -> None:
-        """Check if a parent task can be marked as completed"""
-        parent_task = self.get_task(parent_task_id)
-        if not parent_task:
-            return
+        """Mark ancestors as completed, walking up while all their subtasks are completed"""
+        while parent_task_id:
+            parent_task = self.get_task(parent_task_id)
+            if not parent_task:
+                return
+                
+            # Check if all subtasks are completed
+            if not self._children.get(parent_task_id) or self._pending.get(parent_task_id, 0):
+                return
+                
+            self._set_task_status(parent_task, TaskStatus.COMPLETED, "All subtasks completed")
+            parent_task_id = parent_task.parent_task_id
+            
+    def _set_task_status(self, task: Task, status: TaskStatus, message: str = None) -> None:
+        """Update a task's status, keeping the root task counters in step"""
+        is_root = task.task_id in self._root_ids
+        if is_root:
+            self._count_root_status(task.status, -1)
+            
+        was_completed = task.status == TaskStatus.COMPLETED
+        task.update_status(status, message)
+        self._save_task(task)
+        
+        if is_root:
+            self._count_root_status(status, 1)
             
-        # Check if all subtasks are completed
-        subtasks = self.get_task_subtasks(parent_task_id)
-        if all(task.status == TaskStatus.COMPLETED for task in subtasks):
-            self.update_task_status(
-                parent_task_id,
-                TaskStatus.COMPLETED,
-                "All subtasks completed"
-            )
+        # Keep the parent's count of unfinished subtasks in step
+        is_completed = status == TaskStatus.COMPLETED
+        if was_completed != is_completed and task.parent_task_id in self._pending:
+            self._pending[task.parent_task_id] += -1 if is_completed else 1
+            
+    def _count_root_status(self, status: TaskStatus, delta: int) -> None:
+        """Adjust the completed/failed root task counters for a status"""
+        if status == TaskStatus.COMPLETED:
+            self._root_completed += delta
+        elif status == TaskStatus.FAILED:
+            self._root_failed += delta
+            
+    def _rebuild_children_index(self) -> None:
+        """Rebuild the parent to subtasks index and pending counts from the loaded tasks"""
+        self._children = defaultdict(list)
+        for task in self.tasks.values():
+            for subtask_id in task.subtask_ids:
+                subtask = self.tasks.get(subtask_id)
+                if subtask:
+                    self._children[task.task_id].append(subtask)
+                    
+        self._pending = {
+            parent_task_id: sum(subtask.status != TaskStatus.COMPLETED for subtask in subtasks)
+            for parent_task_id, subtasks in self._children.items()
+        }
+            
+    def _recount_root_statuses(self) -> None:
+        """Rebuild the root task counters from the loaded tasks"""
+        self._root_ids = set(self.root_tasks)
+        self._root_count = self._root_completed = self._root_failed = 0
+        for task_id in self._root_ids:
+            task = self.tasks.get(task_id)
+            if task:
+                self._root_count += 1
+                self._count_root_status(task.status, 1)
             
     def _update_project_status(self) -> None:
         """Update project status based on root tasks"""
         if not self.root_tasks:
             return
             
-        root_task_statuses = [
-            self.tasks[task_id].status
-            for task_id in self.root_tasks
-            if task_id in self.tasks
-        ]
-        
-        if all(status == TaskStatus.COMPLETED for status in root_task_statuses):
+        if self._root_completed == self._root_count:
             self.status = ProjectStatus.COMPLETED
-        elif any(status == TaskStatus.FAILED for status in root_task_statuses):
+        elif self._root_failed:
             self.status = ProjectStatus.FAILED
         else:
             self.status = ProjectStatus.ACTIVE
@@ -173,16 +275,75 @@ class Project:
         self._save_project_state()
         
     def _save_task(self, task: Task) -> None:
-        """Save task to file"""
-        task_dir = os.path.join(self.project_path, "tasks")
+        """Mark task as needing to be written on the next flush"""
+        self._dirty_tasks[task.task_id] = task
+        
+    def _save_project_state(self) -> None:
+        """Mark project state as needing to be written on the next flush"""
+        self._dirty_project = True
+        
+    def _flush_unless_batched(self) -> None:
+        """Flush pending writes unless a `with project:` batch is open"""
+        if not self._batch_depth:
+            self.flush()
+        
+    def flush(self) -> None:
+        """Write modified task files and project state to disk"""
+        dirty_tasks, self._dirty_tasks = self._dirty_tasks, {}
+        for task in dirty_tasks.values():
+            self._write_task(task)
+            
+        if self._dirty_project:
+            self._dirty_project = False
+            self._write_project_state()
+        
+    async def aflush(self) -> None:
+        """Write pending changes from a worker thread without blocking the event loop"""
+        await asyncio.to_thread(self.flush)
+        
+    async def aadd_task(self, task: Task, parent_task_id: Optional[str] = None) -> None:
+        """
+        Add a task to the project from async code.
+        
+        Args:
+            task (Task): Task to add
+            parent_task_id (Optional[str]): ID of parent task if this is a subtask
+        """
+        self._batch_depth += 1
+        try:
+            self.add_task(task, parent_task_id)
+        finally:
+            self._batch_depth -= 1
+        await self.aflush()
+        
+    async def aupdate_task_status(self, task_id: str, status: TaskStatus, message: str = None) -> None:
+        """
+        Update a task's status from async code.
+        
+        Args:
+            task_id (str): Task ID to update
+            status (TaskStatus): New status
+            message (str, optional): Status update message
+        """
+        self._batch_depth += 1
+        try:
+            self.update_task_status(task_id, status, message)
+        finally:
+            self._batch_depth -= 1
+        await self.aflush()
+        
+    def _write_task(self, task: Task) -> None:
+        """Write task to file"""
+        task_dir = self._ensure_subdir("tasks")
         task_path = os.path.join(task_dir, f"{task.task_id}.json")
         
-        with open(task_path, 'w') as f:
-            json.dump(task.to_dict(), f, indent=4)
+        with open(task_path, 'wb') as f:
+            f.write(dumps_bytes(task.to_dict(), indent=True))
             
-    def _save_project_state(self) -> None:
-        """Save project state to file"""
-        project_file = os.path.join(self.project_path, "project.json")
+    def _write_project_state(self) -> None:
+        """Write project state to file"""
+        project_file = os.path.join(self._ensure_subdir(), "project.json")
+        self.updated_at = datetime.now().isoformat()
         
         project_state = {
             "project_id": self.project_id,
@@ -192,17 +353,31 @@ class Project:
             "all_tasks": self.all_tasks,
             "status": self.status.value,
             "created_at": self.created_at,
-            "updated_at": datetime.now().isoformat()
+            "updated_at": self.updated_at
         }
         
-        with open(project_file, 'w') as f:
-            json.dump(project_state, f, indent=4)
+        with open(project_file, 'wb') as f:
+            f.write(dumps_bytes(project_state, indent=True))
             
     @classmethod
     def load_project(cls, project_id: str, base_path: str = "projects") -> Optional['Project']:
         """
         Load a project from disk.
         
+        Args:
+            project_id (str): Project ID to load
+            base_path (str): Base directory for project files
+            
+        Returns:
+            Optional[Project]: Project if found, None otherwise
+        """
+        return asyncio.run(cls.aload_project(project_id, base_path))
+        
+    @classmethod
+    async def aload_project(cls, project_id: str, base_path: str = "projects") -> Optional['Project']:
+        """
+        Load a project from disk, reading its task files concurrently.
+        
         Args:
             project_id (str): Project ID to load
             base_path (str): Base directory for project files
@@ -216,8 +391,8 @@ class Project:
         if not os.path.exists(project_file):
             return None
             
-        with open(project_file, 'r') as f:
-            project_data = json.load(f)
+        async with aiofiles.open(project_file, 'rb') as f:
+            project_data = loads_bytes(await f.read())
             
         project = cls(project_data["name"], project_data["description"], base_path)
         project.project_id = project_data["project_id"]
@@ -229,19 +404,21 @@ class Project:
         
         # Load all tasks
         tasks_dir = os.path.join(project_path, "tasks")
-        for task_file in os.listdir(tasks_dir):
-            if task_file.endswith(".json"):
-                task_path = os.path.join(tasks_dir, task_file)
-                with open(task_path, 'r') as f:
-                    task_data = json.load(f)
-                    task = Task.from_dict(task_data)
-                    project.tasks[task.task_id] = task
+        task_paths = []
+        if os.path.isdir(tasks_dir):
+            with os.scandir(tasks_dir) as entries:
+                task_paths = [entry.path for entry in entries if entry.name.endswith(".json")]
+        for task in await asyncio.gather(*(_read_task(path) for path in task_paths)):
+            project.tasks[task.task_id] = task
+        project._rebuild_children_index()
+        project._recount_root_statuses()
                     
         return project 
 
     def save(self) -> None:
-        """Save project state to file"""
-        self._save_project_state() 
+        """Save project state and any pending task changes to file"""
+        self._save_project_state()
+        self.flush()
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any], base_path: str = "projects") -> 'Project':
@@ -262,4 +439,5 @@ class Project:
         project.status = ProjectStatus(data["status"])
         project.created_at = data["created_at"]
         project.updated_at = data["updated_at"]
+        project._recount_root_statuses()
         return project 
\ No newline at end of file
@@ -2,14 +2,38 @@
 Comprehensive prompt logging system to track the full prompt-response-feedback cycle
 """
 
-import json
+import time
+import asyncio
+import queue
+import atexit
 import logging
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, asdict
+from typing import Optional, BinaryIO, Dict, Any, Iterator, List, Tuple
+from dataclasses import dataclass
+from collections import Counter, defaultdict
+from common.json_utils import dumps_bytes, loads_bytes
 
-@dataclass
+# Maximum number of queued executions written to disk in one batch
+WRITE_BATCH_SIZE = 32
+
+def _theme_words(feedback_content: str) -> List[str]:
+    """Simple keyword extraction, skipping short words"""
+    return [word for word in feedback_content.lower().split() if len(word) > 4]
+
+def _new_agent_stats() -> Dict[str, Any]:
+    """Create the rolling counters kept for one agent type"""
+    return {
+        # Epoch hour -> [total, first attempts, first attempts needing retry]
+        "hourly": defaultdict(lambda: [0, 0, 0]),
+        "feedback": 0,
+        "conf_sum": 0.0,
+        "retries": 0,
+        "themes": Counter()
+    }
+
+@dataclass(slots=True)
 class PromptExecution:
     """Complete record of a prompt execution"""
     timestamp: datetime
@@ -40,9 +64,25 @@ class PromptExecution:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "task_id": self.task_id,
+            "agent_type": self.agent_type,
+            "attempt_number": self.attempt_number,
+            "prompt": self.prompt,
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "response": self.response,
+            "execution_time": self.execution_time,
+            "success": self.success,
+            "received_feedback": self.received_feedback,
+            "feedback_content": self.feedback_content,
+            "feedback_confidence": self.feedback_confidence,
+            "needs_retry": self.needs_retry,
+            "original_task": self.original_task,
+            "enhanced_task": self.enhanced_task
+        }
 
 class PromptLogger:
     """Logs complete prompt-response-feedback cycles for analysis"""
@@ -50,6 +90,10 @@ class PromptLogger:
     def __init__(self):
         self.logger = logging.getLogger(f"{__name__}.PromptLogger")
         self.executions: List[PromptExecution] = []
+        # Latest execution per (task_id, agent_type, attempt_number)
+        self._index: Dict[Tuple[str, str, int], PromptExecution] = {}
+        # Rolling analytics counters per agent type
+        self._stats: Dict[str, Dict[str, Any]] = defaultdict(_new_agent_stats)
 
         # Create logs directory
         self.log_dir = Path("logs/prompts")
@@ -57,6 +101,15 @@ class PromptLogger:
 
         # Load existing executions from log files
         self._load_existing_executions()
+
+        # Open daily log files keyed by ISO date, owned by the writer thread
+        self._log_files: Dict[str, BinaryIO] = {}
+
+        # Executions are appended to disk in batches by a background writer
+        self._write_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="PromptLoggerWriter", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
     
     def log_prompt_execution(self, 
                            task_id: str,
@@ -90,6 +143,8 @@ class PromptLogger:
         )
         
         self.executions.append(execution)
+        self._index[(task_id, agent_type, attempt_number)] = execution
+        self._count_execution(execution, 1)
         self._save_execution(execution)
         
         self.logger.info(
@@ -109,55 +164,89 @@ class PromptLogger:
         """Update execution record with feedback information"""
         
         # Find the matching execution
-        for execution in reversed(self.executions):
-            if (execution.task_id == task_id and 
-                execution.agent_type == agent_type and 
-                execution.attempt_number == attempt_number):
-                
-                execution.received_feedback = True
-                execution.feedback_content = feedback_content
-                execution.feedback_confidence = feedback_confidence
-                execution.needs_retry = needs_retry
-                
-                # Re-save with updated feedback
-                self._save_execution(execution)
-                
-                self.logger.info(
-                    f"FEEDBACK RECEIVED: {agent_type} attempt #{attempt_number} for {task_id} "
-                    f"(confidence: {feedback_confidence:.2f}, retry: {needs_retry})"
-                )
-                break
+        execution = self._index.get((task_id, agent_type, attempt_number))
+        if execution:
+            self._count_execution(execution, -1)
+            execution.received_feedback = True
+            execution.feedback_content = feedback_content
+            execution.feedback_confidence = feedback_confidence
+            execution.needs_retry = needs_retry
+            self._count_execution(execution, 1)
+            
+            # Re-save with updated feedback
+            self._save_execution(execution)
+            
+            self.logger.info(
+                f"FEEDBACK RECEIVED: {agent_type} attempt #{attempt_number} for {task_id} "
+                f"(confidence: {feedback_confidence:.2f}, retry: {needs_retry})"
+            )
+    
+    def _count_execution(self, execution: PromptExecution, sign: int, count_themes: bool = True) -> None:
+        """Add (sign=1) or remove (sign=-1) an execution from the rolling counters"""
+        stats = self._stats[execution.agent_type]
+        
+        bucket = stats["hourly"][int(execution.timestamp.timestamp() // 3600)]
+        bucket[0] += sign
+        if execution.attempt_number == 1:
+            bucket[1] += sign
+            if execution.needs_retry:
+                bucket[2] += sign
+        
+        if execution.received_feedback:
+            stats["feedback"] += sign
+            stats["conf_sum"] += sign * (execution.feedback_confidence or 0.0)
+            if execution.needs_retry:
+                stats["retries"] += sign
+            if execution.feedback_content and count_themes:
+                themes = stats["themes"]
+                words = _theme_words(execution.feedback_content)
+                if sign > 0:
+                    themes.update(words)
+                else:
+                    themes.subtract(words)
+                    for word in words:
+                        if themes[word] <= 0:
+                            del themes[word]
     
     def get_prompt_success_rate(self, agent_type: str, hours: int = 24) -> Dict[str, Any]:
-        """Get first-shot success rate for an agent"""
-        cutoff = datetime.now() - timedelta(hours=hours)
-        recent_executions = [e for e in self.executions 
-                           if e.agent_type == agent_type and e.timestamp > cutoff]
+        """Get first-shot success rate for an agent (window resolved to whole hours)"""
+        stats = self._stats.get(agent_type)
+        cutoff_hour = int(time.time() // 3600) - hours
         
-        if not recent_executions:
+        total_attempts = first_attempts = first_retries = 0
+        if stats:
+            for hour, (total, first, retried) in stats["hourly"].items():
+                if hour >= cutoff_hour:
+                    total_attempts += total
+                    first_attempts += first
+                    first_retries += retried
+        
+        if not total_attempts:
             return {"success_rate": 0.0, "total_attempts": 0, "first_shot_success": 0}
         
-        first_attempts = [e for e in recent_executions if e.attempt_number == 1]
-        successful_first_attempts = [e for e in first_attempts if not e.needs_retry]
+        first_shot_success = first_attempts - first_retries
         
         return {
-            "success_rate": len(successful_first_attempts) / len(first_attempts) if first_attempts else 0.0,
-            "total_attempts": len(recent_executions),
-            "first_shot_success": len(successful_first_attempts),
-            "first_attempts": len(first_attempts),
-            "retry_attempts": len(recent_executions) - len(first_attempts)
+            "success_rate": first_shot_success / first_attempts if first_attempts else 0.0,
+            "total_attempts": total_attempts,
+            "first_shot_success": first_shot_success,
+            "first_attempts": first_attempts,
+            "retry_attempts": total_attempts - first_attempts
         }
     
     def get_prompt_patterns(self, agent_type: str, successful_only: bool = True) -> List[Dict[str, Any]]:
         """Get prompt patterns for successful executions"""
-        executions = [e for e in self.executions if e.agent_type == agent_type]
-        
-        if successful_only:
-            executions = [e for e in executions if not e.needs_retry]
-        
-        patterns = []
-        for execution in executions:
-            patterns.append({
+        return list(self._iter_prompt_patterns(agent_type, successful_only))
+    
+    def _iter_prompt_patterns(self, agent_type: str, successful_only: bool = True) -> Iterator[Dict[str, Any]]:
+        """Yield prompt patterns one execution at a time"""
+        for execution in self.executions:
+            if execution.agent_type != agent_type:
+                continue
+            if successful_only and execution.needs_retry:
+                continue
+            
+            yield {
                 "task_id": execution.task_id,
                 "prompt_length": len(execution.prompt),
                 "response_length": len(execution.response),
@@ -165,67 +254,106 @@ class PromptLogger:
                 "attempt_number": execution.attempt_number,
                 "enhanced": execution.enhanced_task is not None,
                 "feedback_confidence": execution.feedback_confidence
-            })
-        
-        return patterns
+            }
     
     def get_feedback_analysis(self, agent_type: str) -> Dict[str, Any]:
         """Analyze feedback patterns for an agent"""
-        executions = [e for e in self.executions 
-                     if e.agent_type == agent_type and e.received_feedback]
+        stats = self._stats.get(agent_type)
         
-        if not executions:
+        if not stats or not stats["feedback"]:
             return {"total_feedback": 0, "avg_confidence": 0.0, "retry_rate": 0.0}
         
-        total_feedback = len(executions)
-        avg_confidence = sum(e.feedback_confidence for e in executions) / total_feedback
-        retry_count = sum(1 for e in executions if e.needs_retry)
-        
-        # Common feedback themes
-        feedback_themes = {}
-        for execution in executions:
-            if execution.feedback_content:
-                # Simple keyword extraction
-                words = execution.feedback_content.lower().split()
-                for word in words:
-                    if len(word) > 4:  # Skip short words
-                        feedback_themes[word] = feedback_themes.get(word, 0) + 1
+        total_feedback = stats["feedback"]
         
         # Top themes
-        top_themes = sorted(feedback_themes.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_themes = stats["themes"].most_common(10)
         
         return {
             "total_feedback": total_feedback,
-            "avg_confidence": avg_confidence,
-            "retry_rate": retry_count / total_feedback,
+            "avg_confidence": stats["conf_sum"] / total_feedback,
+            "retry_rate": stats["retries"] / total_feedback,
             "common_themes": [{"theme": theme, "count": count} for theme, count in top_themes]
         }
     
     def _save_execution(self, execution: PromptExecution) -> None:
-        """Save execution to file"""
-        try:
-            filename = self.log_dir / f"prompts_{execution.timestamp.strftime('%Y%m%d')}.jsonl"
-            with open(filename, 'a') as f:
-                f.write(json.dumps(execution.to_dict()) + '\n')
-        except Exception as e:
-            self.logger.error(f"Failed to save prompt execution: {e}")
+        """Queue execution to be appended to its daily log file"""
+        self._write_queue.put_nowait(execution.to_dict())
     
-    def export_analysis(self, output_file: str = "prompt_analysis.json") -> None:
-        """Export comprehensive analysis to file"""
-        analysis = {}
-        
-        # Get unique agent types
-        agent_types = list(set(e.agent_type for e in self.executions))
+    def _write_loop(self) -> None:
+        """Drain the write queue, writing up to WRITE_BATCH_SIZE records at a time"""
+        while True:
+            batch = [self._write_queue.get()]
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                self.logger.error(f"Failed to save prompt executions: {e}")
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+    
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        """Append serialized records to their daily log files"""
+        for record in records:
+            self._log_file(record['timestamp']).write(dumps_bytes(record) + b'\n')
         
-        for agent_type in agent_types:
-            analysis[agent_type] = {
-                "success_rate": self.get_prompt_success_rate(agent_type),
-                "feedback_analysis": self.get_feedback_analysis(agent_type),
-                "prompt_patterns": self.get_prompt_patterns(agent_type)
-            }
+        # Push buffered lines to disk once the writer has caught up
+        if self._write_queue.empty():
+            for log_file in self._log_files.values():
+                log_file.flush()
+    
+    def _log_file(self, timestamp: str) -> BinaryIO:
+        """Get the open daily log file for an ISO timestamp, rotating on a new day"""
+        day = timestamp[:10]
+        log_file = self._log_files.get(day)
+        if log_file is None:
+            # Close files for earlier days, they are reopened if still needed
+            for old_day in [d for d in self._log_files if d < day]:
+                self._log_files.pop(old_day).close()
+            
+            filename = self.log_dir / f"prompts_{day.replace('-', '')}.jsonl"
+            log_file = self._log_files[day] = open(filename, 'ab', buffering=64 * 1024)
+        return log_file
+    
+    def flush(self) -> None:
+        """Block until all queued executions have been written to disk"""
+        self._write_queue.join()
+    
+    def close(self) -> None:
+        """Write queued executions and close the open log files"""
+        self.flush()
+        log_files, self._log_files = self._log_files, {}
+        for log_file in log_files.values():
+            log_file.close()
+    
+    async def aflush(self) -> None:
+        """Wait for queued executions to be written without blocking the event loop"""
+        await asyncio.to_thread(self.flush)
+    
+    def export_analysis(self, output_file: str = "prompt_analysis.json") -> None:
+        """Export comprehensive analysis to file, streamed one agent at a time"""
+        self.flush()
         
-        with open(output_file, 'w') as f:
-            json.dump(analysis, f, indent=2, default=str)
+        with open(output_file, 'wb') as f:
+            f.write(b'{')
+            for i, agent_type in enumerate(list(self._stats)):
+                f.write(b',\n' if i else b'\n')
+                f.write(dumps_bytes(agent_type) + b': {"success_rate": ')
+                f.write(dumps_bytes(self.get_prompt_success_rate(agent_type), default=str))
+                f.write(b', "feedback_analysis": ')
+                f.write(dumps_bytes(self.get_feedback_analysis(agent_type), default=str))
+                f.write(b', "prompt_patterns": [')
+                for j, pattern in enumerate(self._iter_prompt_patterns(agent_type)):
+                    if j:
+                        f.write(b', ')
+                    f.write(dumps_bytes(pattern, default=str))
+                f.write(b']}')
+            f.write(b'\n}\n')
         
         self.logger.info(f"Analysis exported to {output_file}")
 
@@ -234,20 +362,29 @@ class PromptLogger:
         try:
             # Load from all existing log files
             log_files = list(self.log_dir.glob("prompts_*.jsonl"))
+            # Feedback per agent type, counted into themes in one pass at the end
+            feedback_contents: Dict[str, List[str]] = defaultdict(list)
 
             for log_file in log_files:
                 try:
-                    with open(log_file, 'r') as f:
+                    with open(log_file, 'rb') as f:
                         for line in f:
                             if line.strip():
-                                data = json.loads(line)
+                                data = loads_bytes(line)
                                 # Convert timestamp back to datetime
                                 data['timestamp'] = datetime.fromisoformat(data['timestamp'])
                                 execution = PromptExecution(**data)
                                 self.executions.append(execution)
+                                self._index[(execution.task_id, execution.agent_type, execution.attempt_number)] = execution
+                                self._count_execution(execution, 1, count_themes=False)
+                                if execution.received_feedback and execution.feedback_content:
+                                    feedback_contents[execution.agent_type].append(execution.feedback_content)
                 except Exception as e:
                     self.logger.warning(f"Failed to load executions from {log_file}: {e}")
 
+            for agent_type, contents in feedback_contents.items():
+                self._stats[agent_type]["themes"].update(_theme_words("\n".join(contents)))
+
             self.logger.info(f"Loaded {len(self.executions)} existing prompt executions")
 
         except Exception as e:
@@ -6,6 +6,7 @@ from enum import Enum
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import uuid
+import operator
 
 class TaskStatus(Enum):
     """Task status enumeration"""
@@ -24,11 +25,30 @@ class TaskStatus(Enum):
     ERROR = "error"
     NEEDS_REVISION = "needs_revision"
 
+# Status lookup by stored value, cheaper than TaskStatus(value) when loading tasks in bulk
+_STATUS_BY_VALUE = {status.value: status for status in TaskStatus}
+
+# Serialized task fields in to_dict order, read with one attrgetter call
+_TASK_KEYS = (
+    "task_id", "description", "language", "requirements", "priority", "status",
+    "created_at", "updated_at", "history", "project_id", "parent_task_id",
+    "subtask_ids", "related_task_ids", "code", "test_results", "quality_results",
+    "integration_results"
+)
+_TASK_GET = operator.attrgetter(*_TASK_KEYS)
+
 class Task:
     """
     Represents a development task with its associated metadata, code, and status.
     """
     
+    __slots__ = (
+        "task_id", "description", "language", "requirements", "priority", "status",
+        "created_at", "updated_at", "history", "project_id", "parent_task_id",
+        "subtask_ids", "related_task_ids", "_related_set", "code", "test_results",
+        "quality_results", "integration_results"
+    )
+    
     def __init__(self, description: str, language: str, requirements: List[str] = None, priority: float = 50.0):
         """
         Initialize a new task.
@@ -45,7 +65,7 @@ class Task:
                 - 20-39: Low priority enhancements
                 - 0-19: Nice-to-have features
         """
-        self.task_id = f"TASK-{str(uuid.uuid4())[:8]}"
+        self.task_id = "TASK-" + uuid.uuid4().hex[:8]
         self.description = description
         self.language = language
         self.requirements = requirements or []
@@ -60,6 +80,7 @@ class Task:
         self.parent_task_id = None  # Reference to parent task if it's a subtask
         self.subtask_ids = []  # List of child task IDs
         self.related_task_ids = []  # Tasks that are related but not hierarchical
+        self._related_set = set()  # Membership index over related_task_ids
         
         # Implementation details
         self.code = {
@@ -70,6 +91,16 @@ class Task:
         self.quality_results = None
         self.integration_results = None
         
+    def _touch(self) -> str:
+        """
+        Stamp the task as updated now.
+        
+        Returns:
+            str: The new updated_at timestamp, for reuse in the history entry
+        """
+        self.updated_at = now = datetime.now().isoformat()
+        return now
+        
     def update_status(self, status: TaskStatus, message: str = None):
         """
         Update the task status and add a history entry.
@@ -79,10 +110,9 @@ class Task:
             message (str, optional): Status update message. Defaults to None.
         """
         self.status = status
-        self.updated_at = datetime.now().isoformat()
         
         history_entry = {
-            "timestamp": self.updated_at,
+            "timestamp": self._touch(),
             "status": status.value,
             "message": message or f"Status updated to {status.value}"
         }
@@ -98,10 +128,9 @@ class Task:
         """
         old_priority = self.priority
         self.priority = max(0.0, min(100.0, new_priority))  # Clamp between 0 and 100
-        self.updated_at = datetime.now().isoformat()
         
         history_entry = {
-            "timestamp": self.updated_at,
+            "timestamp": self._touch(),
             "type": "priority_change",
             "old_priority": old_priority,
             "new_priority": self.priority,
@@ -117,12 +146,12 @@ class Task:
             task_id (str): ID of the related task
             relationship_type (str, optional): Type of relationship. Defaults to "related".
         """
-        if task_id not in self.related_task_ids:
+        if task_id not in self._related_set:
+            self._related_set.add(task_id)
             self.related_task_ids.append(task_id)
-            self.updated_at = datetime.now().isoformat()
             
             history_entry = {
-                "timestamp": self.updated_at,
+                "timestamp": self._touch(),
                 "type": "relationship_added",
                 "related_task": task_id,
                 "relationship_type": relationship_type
@@ -136,25 +165,9 @@ class Task:
         Returns:
             Dict[str, Any]: Dictionary representation of the task
         """
-        return {
-            "task_id": self.task_id,
-            "description": self.description,
-            "language": self.language,
-            "requirements": self.requirements,
-            "priority": self.priority,
-            "status": self.status.value,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "history": self.history,
-            "project_id": self.project_id,
-            "parent_task_id": self.parent_task_id,
-            "subtask_ids": self.subtask_ids,
-            "related_task_ids": self.related_task_ids,
-            "code": self.code,
-            "test_results": self.test_results,
-            "quality_results": self.quality_results,
-            "integration_results": self.integration_results
-        }
+        data = dict(zip(_TASK_KEYS, _TASK_GET(self)))
+        data["status"] = self.status.value
+        return data
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Task':
@@ -167,14 +180,15 @@ class Task:
         Returns:
             Task: New Task instance
         """
-        task = cls(
-            data["description"], 
-            data["language"], 
-            data.get("requirements", []),
-            data.get("priority", 50.0)
-        )
+        # Bypass __init__: every field is restored below, so generating a
+        # fresh ID and creation timestamp per loaded task would be wasted work
+        task = cls.__new__(cls)
+        task.description = data["description"]
+        task.language = data["language"]
+        task.requirements = data.get("requirements") or []
+        task.priority = max(0.0, min(100.0, data.get("priority", 50.0)))
         task.task_id = data["task_id"]
-        task.status = TaskStatus(data["status"])
+        task.status = _STATUS_BY_VALUE[data["status"]]
         task.created_at = data["created_at"]
         task.updated_at = data["updated_at"]
         task.history = data["history"]
@@ -182,6 +196,7 @@ class Task:
         task.parent_task_id = data.get("parent_task_id")
         task.subtask_ids = data.get("subtask_ids", [])
         task.related_task_ids = data.get("related_task_ids", [])
+        task._related_set = set(task.related_task_ids)
         task.code = data["code"]
         task.test_results = data.get("test_results")
         task.quality_results = data.get("quality_results")
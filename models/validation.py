@@ -2,15 +2,43 @@
 Validation models for peer review system.
 """
 
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, BinaryIO, Iterator
 from datetime import datetime, timedelta
+import os
 import json
+import heapq
+import queue
+import atexit
 import logging
+import threading
+from pathlib import Path
+
+from common.json_utils import dumps_bytes, loads_bytes
+
+try:
+    import msgpack
+except ImportError:  # msgpack is only needed for the binary feedback log format
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Shared decoder for pulling the JSON object out of validation responses
+_DECODER = json.JSONDecoder()
+
+# Upper bound on in-memory feedback entries; older entries are evicted first
+# (they remain available in logs/feedback).
+FEEDBACK_LOG_MAX = 10_000
+
+# Maximum number of queued feedback records written to disk in one batch
+WRITE_BATCH_SIZE = 64
+
+# On-disk feedback log formats, also used as the file extension. The dashboard
+# reads jsonl, so msgpack is opt-in via FEEDBACK_LOG_FORMAT=msgpack.
+FEEDBACK_LOG_FORMATS = ('jsonl', 'msgpack')
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of agent validation of previous agent's work"""
     is_valid: bool
@@ -25,15 +53,15 @@ class ValidationResult:
         """Parse validation result from JSON response"""
         try:
             # Log the raw response for debugging
-            logger.debug(f"Raw validation response: {json_str[:200]}...")
+            logger.debug("Raw validation response: %.200s...", json_str)
 
-            # Try to extract JSON from the response if it's wrapped in text
+            # Try to extract JSON from the response if it's wrapped in text;
+            # raw_decode stops at the end of the first object, so braces in
+            # any trailing text don't matter
             json_start = json_str.find('{')
-            json_end = json_str.rfind('}') + 1
 
-            if json_start >= 0 and json_end > json_start:
-                json_part = json_str[json_start:json_end]
-                data = json.loads(json_part)
+            if json_start >= 0:
+                data, _ = _DECODER.raw_decode(json_str, json_start)
             else:
                 # If no JSON found, create a simple validation result
                 logger.warning(f"No JSON found in response, treating as invalid: {json_str[:100]}...")
@@ -54,7 +82,7 @@ class ValidationResult:
                 can_proceed=data.get('can_proceed', False),
                 validation_details=data
             )
-        except (json.JSONDecodeError, KeyError) as e:
+        except (ValueError, KeyError) as e:
             logger.error(f"Failed to parse validation result: {e}")
             logger.error(f"Raw response was: {json_str}")
             return cls(
@@ -65,8 +93,19 @@ class ValidationResult:
                 can_proceed=False,
                 validation_details={"raw_response": json_str, "error": str(e)}
             )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for storage"""
+        return {
+            'is_valid': self.is_valid,
+            'confidence': self.confidence,
+            'issues': list(self.issues),
+            'feedback': self.feedback,
+            'can_proceed': self.can_proceed,
+            'validation_details': self.validation_details
+        }
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult:
     """Result from agent execution"""
     success: bool
@@ -93,13 +132,13 @@ class AgentResult:
             'execution_time': self.execution_time,
             'model_used': self.model_used,
             'validation_performed': self.validation_performed,
-            'validation_result': self.validation_result.__dict__ if self.validation_result else None,
+            'validation_result': self.validation_result.to_dict() if self.validation_result else None,
             'feedback_for_previous_agent': self.feedback_for_previous_agent,
             'should_retry_previous': self.should_retry_previous,
             'retry_attempt': self.retry_attempt
         }
 
-@dataclass
+@dataclass(slots=True)
 class FeedbackEntry:
     """Single feedback entry between agents"""
     timestamp: datetime
@@ -124,12 +163,62 @@ class FeedbackEntry:
             'retry_successful': self.retry_successful
         }
 
+def iter_feedback_log(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Stream feedback records from a daily log file in either format.
+    
+    Args:
+        path (Path): A feedback_YYYYMMDD.jsonl or .msgpack file
+        
+    Returns:
+        Iterator[Dict[str, Any]]: Feedback records in file order
+    """
+    with open(path, 'rb') as f:
+        if Path(path).suffix == '.msgpack':
+            if msgpack is None:
+                raise ImportError("msgpack is required to read binary feedback logs")
+            yield from msgpack.Unpacker(f, raw=False)
+        else:
+            for line in f:
+                if line.strip():
+                    yield loads_bytes(line)
+
 class FeedbackTracker:
     """Tracks inter-agent feedback and learning patterns"""
     
-    def __init__(self):
-        self.feedback_log: List[FeedbackEntry] = []
+    def __init__(self, max_entries: int = FEEDBACK_LOG_MAX, log_format: Optional[str] = None):
         self.logger = logging.getLogger(f"{__name__}.FeedbackTracker")
+        self.feedback_log: deque = deque(maxlen=max_entries)
+        self._agent_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+            'received_count': 0,
+            'issue_counts': Counter(),
+            'confidence_sum': 0.0,
+            'retry_success': 0,
+            'retry_total': 0
+        })
+        self._last_entry_by_key: Dict[Tuple[str, str, str], FeedbackEntry] = {}
+        # Materialized get_feedback_stats result, dropped whenever the aggregates change
+        self._stats_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        # Feedback entries partitioned by task, in log order
+        self._by_task: Dict[str, deque] = defaultdict(deque)
+        # Whether feedback_log is still sorted by timestamp
+        self._time_ordered = True
+        self.log_format = log_format or os.getenv("FEEDBACK_LOG_FORMAT", "jsonl")
+        if self.log_format not in FEEDBACK_LOG_FORMATS:
+            raise ValueError(f"Unknown feedback log format: {self.log_format}")
+        if self.log_format == 'msgpack' and msgpack is None:
+            self.logger.warning("msgpack is not installed, writing feedback logs as jsonl")
+            self.log_format = 'jsonl'
+        
+        # Today's feedback log file, owned by the writer thread
+        self._log_file: Optional[BinaryIO] = None
+        self._log_date: Optional[str] = None
+        
+        # Records are appended to disk in batches by a background writer,
+        # started on the first save so read-only trackers stay threadless
+        self._write_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
     
     def record_feedback(self, from_agent: str, to_agent: str, task_id: str,
                        validation_result: ValidationResult) -> None:
@@ -144,12 +233,22 @@ class FeedbackTracker:
             issues=validation_result.issues
         )
         
+        if self.feedback_log and entry.timestamp < self.feedback_log[-1].timestamp:
+            # Wall clock stepped backwards; recent-feedback lookups can no
+            # longer assume the log is sorted
+            self._time_ordered = False
+        if len(self.feedback_log) == self.feedback_log.maxlen:
+            self._evict_oldest()
         self.feedback_log.append(entry)
+        self._count_entry(entry, 1)
+        self._last_entry_by_key[(task_id, from_agent, to_agent)] = entry
+        self._by_task[task_id].append(entry)
         
         # Log for monitoring
+        # Lazy %-formatting: the message is only built if INFO is enabled
         self.logger.info(
-            f"FEEDBACK: {from_agent} → {to_agent} (confidence: {validation_result.confidence:.2f}): "
-            f"{validation_result.feedback[:100]}..."
+            "FEEDBACK: %s → %s (confidence: %.2f): %.100s...",
+            from_agent, to_agent, validation_result.confidence, validation_result.feedback
         )
         
         # Save to file for analysis
@@ -158,87 +257,168 @@ class FeedbackTracker:
     def update_retry_result(self, task_id: str, from_agent: str, 
                            to_agent: str, success: bool) -> None:
         """Update whether the retry after feedback was successful"""
-        for entry in reversed(self.feedback_log):
-            if (entry.task_id == task_id and 
-                entry.from_agent == from_agent and 
-                entry.to_agent == to_agent):
-                entry.retry_successful = success
-                break
+        entry = self._last_entry_by_key.get((task_id, from_agent, to_agent))
+        if entry:
+            self._count_entry(entry, -1)
+            entry.retry_successful = success
+            self._count_entry(entry, 1)
+    
+    def _evict_oldest(self) -> None:
+        """Drop the oldest entry from the log, aggregates and indexes"""
+        entry = self.feedback_log.popleft()
+        self._count_entry(entry, -1)
+        key = (entry.task_id, entry.from_agent, entry.to_agent)
+        if self._last_entry_by_key.get(key) is entry:
+            del self._last_entry_by_key[key]
+        
+        # The evicted entry is the oldest overall, so also the oldest for its task
+        task_entries = self._by_task[entry.task_id]
+        task_entries.popleft()
+        if not task_entries:
+            del self._by_task[entry.task_id]
+    
+    def _count_entry(self, entry: FeedbackEntry, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) an entry from the per-agent aggregates"""
+        self._stats_cache = None
+        agent_stats = self._agent_stats[entry.to_agent]
+        agent_stats['received_count'] += sign
+        agent_stats['confidence_sum'] += sign * entry.validation_confidence
+        
+        issue_counts = agent_stats['issue_counts']
+        if sign > 0:
+            issue_counts.update(entry.issues)
+        else:
+            issue_counts.subtract(entry.issues)
+            for issue in entry.issues:
+                if issue_counts[issue] <= 0:
+                    del issue_counts[issue]
+        
+        if entry.retry_successful is not None:
+            agent_stats['retry_total'] += sign
+            if entry.retry_successful:
+                agent_stats['retry_success'] += sign
+        
+        if agent_stats['received_count'] <= 0:
+            del self._agent_stats[entry.to_agent]
     
     def get_feedback_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get feedback statistics by agent"""
-        stats = {}
-        
-        for entry in self.feedback_log:
-            agent = entry.to_agent
-            if agent not in stats:
+        if self._stats_cache is None:
+            stats = {}
+            for agent, agent_stats in self._agent_stats.items():
+                received = agent_stats['received_count']
+                retry_total = agent_stats['retry_total']
                 stats[agent] = {
-                    'received_count': 0,
-                    'common_issues': [],
-                    'retry_success_rate': 0.0,
-                    'avg_confidence': 0.0
+                    'received_count': received,
+                    'common_issues': [issue for issue, _ in agent_stats['issue_counts'].most_common(5)],
+                    'retry_success_rate': agent_stats['retry_success'] / retry_total if retry_total else 0.0,
+                    'avg_confidence': agent_stats['confidence_sum'] / received
                 }
-            
-            stats[agent]['received_count'] += 1
-            stats[agent]['common_issues'].extend(entry.issues)
-        
-        # Calculate derived stats
-        for agent, agent_stats in stats.items():
-            agent_entries = [e for e in self.feedback_log if e.to_agent == agent]
-            
-            # Common issues (simplified)
-            all_issues = []
-            for entry in agent_entries:
-                all_issues.extend(entry.issues)
-            issue_counts = {}
-            for issue in all_issues:
-                issue_counts[issue] = issue_counts.get(issue, 0) + 1
-            agent_stats['common_issues'] = sorted(issue_counts.keys(), 
-                                                key=lambda x: issue_counts[x], reverse=True)[:5]
-            
-            # Retry success rate
-            retry_entries = [e for e in agent_entries if e.retry_successful is not None]
-            if retry_entries:
-                successful_retries = sum(1 for e in retry_entries if e.retry_successful)
-                agent_stats['retry_success_rate'] = successful_retries / len(retry_entries)
-            
-            # Average confidence
-            if agent_entries:
-                agent_stats['avg_confidence'] = sum(e.validation_confidence for e in agent_entries) / len(agent_entries)
+            self._stats_cache = stats
         
-        return stats
+        # Hand out copies so callers can't modify the cached result
+        return {
+            agent: {**agent_stats, 'common_issues': list(agent_stats['common_issues'])}
+            for agent, agent_stats in self._stats_cache.items()
+        }
     
     def get_recent_feedback(self, hours: int = 24, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent feedback entries"""
         cutoff = datetime.now() - timedelta(hours=hours)
-        recent = [e for e in self.feedback_log if e.timestamp > cutoff]
-        recent.sort(key=lambda x: x.timestamp, reverse=True)
-        return [e.to_dict() for e in recent[:limit]]
+        if not self._time_ordered:
+            recent = heapq.nlargest(limit, (e for e in self.feedback_log if e.timestamp > cutoff),
+                                    key=lambda e: e.timestamp)
+            return [e.to_dict() for e in recent]
+        
+        recent = []
+        # Entries are appended in time order, so walk back from the newest
+        for entry in reversed(self.feedback_log):
+            if entry.timestamp <= cutoff or len(recent) >= limit:
+                break
+            recent.append(entry.to_dict())
+        return recent
+    
+    def get_task_feedback(self, task_id: str) -> List[FeedbackEntry]:
+        """Get feedback entries recorded for a task, oldest first"""
+        return list(self._by_task.get(task_id, ()))
     
     def get_common_issues_for_agent(self, agent_type: str, limit: int = 5) -> List[str]:
         """Get most common issues for a specific agent"""
-        agent_entries = [e for e in self.feedback_log if e.to_agent == agent_type]
-        all_issues = []
-        for entry in agent_entries:
-            all_issues.extend(entry.issues)
+        agent_stats = self._agent_stats.get(agent_type)
+        if not agent_stats:
+            return []
+        return [issue for issue, _ in agent_stats['issue_counts'].most_common(limit)]
+    
+    def _save_feedback_entry(self, entry: FeedbackEntry) -> None:
+        """Queue feedback entry to be appended to its daily log file"""
+        if self._writer is None:
+            self._start_writer()
+        self._write_queue.put_nowait(entry.to_dict())
+    
+    def _start_writer(self) -> None:
+        """Start the background writer thread once"""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="FeedbackWriter", daemon=True)
+                self._writer.start()
+                atexit.register(self.close)
+    
+    def _write_loop(self) -> None:
+        """Drain the write queue, writing up to WRITE_BATCH_SIZE records at a time"""
+        while True:
+            batch = [self._write_queue.get()]
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                self.logger.error(f"Failed to save feedback entries: {e}")
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+    
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        """Append serialized records to their daily log files"""
+        if self.log_format == 'msgpack':
+            encode = msgpack.packb
+        else:
+            encode = lambda record: dumps_bytes(record) + b'\n'
         
-        issue_counts = {}
-        for issue in all_issues:
-            issue_counts[issue] = issue_counts.get(issue, 0) + 1
+        lines_by_date: Dict[str, List[bytes]] = defaultdict(list)
+        for record in records:
+            date_str = record['timestamp'][:10].replace('-', '')
+            lines_by_date[date_str].append(encode(record))
         
-        return sorted(issue_counts.keys(), key=lambda x: issue_counts[x], reverse=True)[:limit]
+        # One unbuffered write per day keeps lines whole when other
+        # trackers append to the same file
+        for date_str, lines in lines_by_date.items():
+            self._get_log_file(date_str).write(b''.join(lines))
     
-    def _save_feedback_entry(self, entry: FeedbackEntry) -> None:
-        """Save feedback entry to file for analysis"""
-        try:
-            import os
-            from pathlib import Path
+    def _get_log_file(self, date_str: str) -> BinaryIO:
+        """Get the open feedback log file for a day, rotating when the date changes"""
+        if date_str != self._log_date:
+            if self._log_file is not None:
+                self._log_file.close()
             
             feedback_dir = Path("logs/feedback")
             feedback_dir.mkdir(parents=True, exist_ok=True)
-            
-            filename = feedback_dir / f"feedback_{entry.timestamp.strftime('%Y%m%d')}.jsonl"
-            with open(filename, 'a') as f:
-                f.write(json.dumps(entry.to_dict()) + '\n')
-        except Exception as e:
-            self.logger.error(f"Failed to save feedback entry: {e}")
+            filename = feedback_dir / f"feedback_{date_str}.{self.log_format}"
+            self._log_file = open(filename, 'ab', buffering=0)
+            self._log_date = date_str
+        return self._log_file
+    
+    def flush(self) -> None:
+        """Block until all queued feedback entries have been written to disk"""
+        self._write_queue.join()
+    
+    def close(self) -> None:
+        """Write queued feedback entries and close the open log file"""
+        self.flush()
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+            self._log_date = None
@@ -94,17 +94,18 @@ def show_sample_logs():
     print("\n📋 SAMPLE LOG ENTRIES")
     print("=" * 30)
     
+    from collections import deque
     from pathlib import Path
-    import json
+    from common.json_utils import loads_bytes
     
     # Show sample prompt log
     prompt_logs = list(Path("logs/prompts").glob("*.jsonl"))
     if prompt_logs:
         print("\n📝 PROMPT LOG SAMPLE:")
-        with open(prompt_logs[0]) as f:
-            lines = f.readlines()
-            if lines:
-                sample = json.loads(lines[0])
+        with open(prompt_logs[0], 'rb') as f:
+            first = next(f, None)
+            if first:
+                sample = loads_bytes(first)
                 print(f"  Task ID: {sample['task_id']}")
                 print(f"  Agent: {sample['agent_type']}")
                 print(f"  Attempt: #{sample['attempt_number']}")
@@ -120,10 +121,10 @@ def show_sample_logs():
     feedback_logs = list(Path("logs/feedback").glob("*.jsonl"))
     if feedback_logs:
         print("\n💬 FEEDBACK LOG SAMPLE:")
-        with open(feedback_logs[0]) as f:
-            lines = f.readlines()
-            if lines:
-                sample = json.loads(lines[-1])  # Get latest
+        with open(feedback_logs[0], 'rb') as f:
+            last = deque(f, maxlen=1)  # Get latest without holding the whole file
+            if last:
+                sample = loads_bytes(last[0])
                 print(f"  From: {sample['from_agent']} → To: {sample['to_agent']}")
                 print(f"  Task ID: {sample['task_id']}")
                 print(f"  Confidence: {sample['validation_confidence']:.2f}")
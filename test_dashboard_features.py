@@ -3,13 +3,171 @@
 Test script to verify the enhanced dashboard features work
 """
 
-import requests
+import re
+import json
+import io
+import sys
 import time
+import argparse
+import asyncio
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Every content marker checked on any page, matched in one scan per chunk.
+# pyahocorasick would do the same, but a regex alternation needs no new dependency.
+CONTENT_MARKERS = (
+    "Peer Review Console", "Live Statistics",
+    "Prompt Analytics", "Agent Performance",
+    "Feedback Dashboard"
+)
+MARKER_PATTERN = re.compile("|".join(map(re.escape, CONTENT_MARKERS)))
+# Text carried between chunks so a marker split across a boundary still matches
+MARKER_OVERLAP = max(map(len, CONTENT_MARKERS)) - 1
+
+# Markers each page must contain
+REQUIRED_MARKERS = {
+    "/peer_review_console": frozenset({"Peer Review Console", "Live Statistics"}),
+    "/prompt_analytics": frozenset({"Prompt Analytics", "Agent Performance"}),
+    "/feedback_dashboard": frozenset({"Feedback Dashboard"})
+}
+
+def find_markers(text: str) -> set:
+    """Return the set of content markers present in a piece of page text"""
+    return set(MARKER_PATTERN.findall(text))
+
+def make_validator(required: FrozenSet[str]) -> Callable[[set], List[str]]:
+    """Specialize a page check for one fixed marker set, returning the missing markers"""
+    def validate(found: set) -> List[str]:
+        return sorted(required - found)
+    return validate
+
+# Per-endpoint page checks, built once at import
+VALIDATORS = {endpoint: make_validator(markers) for endpoint, markers in REQUIRED_MARKERS.items()}
+
+# Machine-readable results of the latest run, for CI
+REPORT_FILE = Path("logs/dashboard_test_report.json")
+
+BASE_URL = "http://localhost:8000"
+
+def scan_page(session: requests.Session, url: str, required: FrozenSet[str]) -> Tuple[int, Optional[int], set]:
+    """
+    Stream a page and collect its content markers without holding the body.
+    
+    Pages with required markers stop downloading once every required marker
+    has been seen. Pages without required markers are status checks only,
+    made with a HEAD request: the server still renders the page, so render
+    failures are reported, but does not send the body.
+    
+    Args:
+        session (requests.Session): Pooled HTTP session
+        url (str): URL to fetch
+        required (FrozenSet[str]): Markers the page must contain
+        
+    Returns:
+        Tuple[int, Optional[int], set]: Status code, characters read (None for
+            status-only checks) and markers found
+    """
+    if not required:
+        # A HEAD response has no body, so the connection goes straight back to the pool
+        response = session.head(url, timeout=10)
+        if response.status_code != 200:
+            return response.status_code, 0, set()
+        return 200, None, set()
+    
+    with session.get(url, stream=True, timeout=10) as response:
+        if response.status_code != 200:
+            return response.status_code, 0, set()
+        
+        response.encoding = response.encoding or "utf-8"
+        length = 0
+        found = set()
+        tail = ""
+        for chunk in response.iter_content(chunk_size=8192, decode_unicode=True):
+            length += len(chunk)
+            window = tail + chunk
+            found |= find_markers(window)
+            tail = window[-MARKER_OVERLAP:]
+            if required <= found:
+                break
+    
+    return 200, length, found
+
+class RateLimiter:
+    """Async token bucket allowing max_rate acquisitions per time_period, with bursts up to max_rate"""
+    
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        self.max_rate = max_rate
+        self.rate = max_rate / time_period
+        self.tokens = max_rate
+        self.last = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.max_rate, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+def create_session() -> requests.Session:
+    """Create an HTTP session that keeps connections to the dashboard alive between requests"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def wait_ready(session: requests.Session, base_url: str, deadline: float = 30.0):
+    """
+    Poll the dashboard with exponential backoff until it answers 200.
+    
+    Args:
+        session (requests.Session): Pooled HTTP session
+        base_url (str): Dashboard root URL
+        deadline (float, optional): Seconds to keep trying. Defaults to 30.0.
+        
+    Raises:
+        RuntimeError: If the dashboard is not ready before the deadline
+    """
+    start = time.monotonic()
+    delay = 0.1
+    while time.monotonic() - start < deadline:
+        try:
+            with session.get(f"{base_url}/", stream=True, timeout=2) as response:
+                if response.status_code == 200:
+                    return
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
+    raise RuntimeError(f"Dashboard at {base_url} not ready after {deadline:.0f}s")
+
+async def _probe_endpoints(base_url: str, endpoints: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Check every endpoint concurrently, returning result rows in endpoint order"""
+    # Be nice to the server: at most 4 requests started per second
+    limit = RateLimiter(max_rate=4, time_period=1.0)
+    
+    async def probe(session: requests.Session, endpoint: str, name: str) -> Dict[str, Any]:
+        async with limit:
+            return await asyncio.to_thread(check_endpoint, session, base_url, endpoint, name)
+    
+    with create_session() as session:
+        return await asyncio.gather(*(probe(session, endpoint, name) for endpoint, name in endpoints))
 
 def test_dashboard_endpoints():
-    """Test all the new dashboard endpoints"""
+    """Test all the new dashboard endpoints concurrently"""
     
-    base_url = "http://localhost:8000"
+    base_url = BASE_URL
     
     endpoints = [
         ("/", "Main Dashboard"),
@@ -23,45 +181,47 @@ def test_dashboard_endpoints():
     print("🧪 Testing Enhanced Dashboard Features")
     print("=" * 50)
     
-    for endpoint, name in endpoints:
-        try:
-            print(f"\n🔍 Testing {name} ({endpoint})")
-            response = requests.get(f"{base_url}{endpoint}", timeout=10)
-            
-            if response.status_code == 200:
-                content_length = len(response.text)
-                print(f"   ✅ SUCCESS - {content_length} characters loaded")
-                
-                # Check for key content
-                if "peer_review_console" in endpoint:
-                    if "Peer Review Console" in response.text and "Live Statistics" in response.text:
-                        print("   ✅ Console content verified")
-                    else:
-                        print("   ⚠️ Console content missing")
-                
-                elif "prompt_analytics" in endpoint:
-                    if "Prompt Analytics" in response.text and "Agent Performance" in response.text:
-                        print("   ✅ Analytics content verified")
-                    else:
-                        print("   ⚠️ Analytics content missing")
-                
-                elif "feedback_dashboard" in endpoint:
-                    if "Feedback Dashboard" in response.text:
-                        print("   ✅ Feedback content verified")
-                    else:
-                        print("   ⚠️ Feedback content missing")
-                        
+    rows = asyncio.run(_probe_endpoints(base_url, endpoints))
+    
+    # Render the whole report, in endpoint order, and write it out once
+    report = io.StringIO()
+    for row in rows:
+        report.write(f"\n🔍 Testing {row['name']} ({row['endpoint']})\n")
+        if row["error"]:
+            report.write(f"   ❌ ERROR - {row['error']}\n")
+        elif row["status"] != 200:
+            report.write(f"   ❌ FAILED - Status code: {row['status']}\n")
+        else:
+            if row["length"] is None:
+                report.write("   ✅ SUCCESS - status only\n")
             else:
-                print(f"   ❌ FAILED - Status code: {response.status_code}")
-                
-        except requests.exceptions.RequestException as e:
-            print(f"   ❌ ERROR - {str(e)}")
-        
-        time.sleep(0.5)  # Be nice to the server
+                report.write(f"   ✅ SUCCESS - {row['length']} characters checked\n")
+            if row["missing"]:
+                report.write(f"   ⚠️ Content missing: {', '.join(row['missing'])}\n")
+            elif row["endpoint"] in REQUIRED_MARKERS:
+                report.write("   ✅ Content verified\n")
+    print(report.getvalue(), end="")
+    
+    REPORT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    REPORT_FILE.write_text(json.dumps(rows, indent=2))
     
     print(f"\n🎉 Dashboard testing completed!")
     print(f"Visit {base_url} to see the enhanced dashboard")
 
+def check_endpoint(session: requests.Session, base_url: str, endpoint: str, name: str) -> Dict[str, Any]:
+    """Fetch one endpoint and verify its key content, returning a result row"""
+    row = {"endpoint": endpoint, "name": name, "status": None, "length": 0, "missing": [], "error": None}
+    try:
+        required = REQUIRED_MARKERS.get(endpoint, frozenset())
+        row["status"], row["length"], found = scan_page(session, f"{base_url}{endpoint}", required)
+        validate = VALIDATORS.get(endpoint)
+        if row["status"] == 200 and validate:
+            row["missing"] = validate(found)
+    except requests.exceptions.RequestException as e:
+        row["error"] = str(e)
+    
+    return row
+
 def show_dashboard_features():
     """Show what features are available"""
     print("\n📋 ENHANCED DASHBOARD FEATURES")
@@ -84,11 +244,26 @@ def show_dashboard_features():
     print(f"\n🌐 Access at: http://localhost:8000")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Test the enhanced dashboard endpoints")
+    parser.add_argument("--interactive", action="store_true",
+                        help="Wait for Enter instead of polling the dashboard until it is up")
+    parser.add_argument("--timeout", type=float, default=30.0,
+                        help="Seconds to wait for the dashboard to come up")
+    args = parser.parse_args()
+    
     print("🚀 Starting dashboard feature test...")
     print("Make sure the dashboard is running: python web_dashboard.py")
     
-    # Wait a moment for user to start dashboard if needed
-    input("\nPress Enter when dashboard is running...")
+    if args.interactive:
+        # Wait for user to start dashboard if needed
+        input("\nPress Enter when dashboard is running...")
+    else:
+        try:
+            with create_session() as session:
+                wait_ready(session, BASE_URL, args.timeout)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
     
     test_dashboard_endpoints()
     show_dashboard_features()
@@ -4,31 +4,60 @@ Web-based Task Management Dashboard
 Provides a web interface for viewing and managing tasks and projects
 """
 import http.server
-import socketserver
 import webbrowser
 import urllib.parse
 import json
 import os
 import uuid
 import datetime
+import functools
 import threading
+import time
 import traceback
+import weakref
 from pathlib import Path
 import random
+import signal
 import string
 import base64
+import concurrent.futures
 from cryptography.fernet import Fernet
 import hashlib
+import mmap
+import operator
+import re
+from common.json_utils import dumps_bytes, loads_bytes
+
+try:
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional; without it every call rescans the directories
+    Observer = None
+
+try:
+    from markupsafe import escape
+except ImportError:  # markupsafe is an optional speedup over the pure Python escape
+    # Same replacements as html.escape, applied in one C-level pass
+    _ESCAPE_TABLE = str.maketrans({
+        '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'
+    })
+    
+    def escape(value):
+        """Escape any value for HTML, converting non-strings like markupsafe does"""
+        return str(value).translate(_ESCAPE_TABLE)
 
 # Constants and configuration
 PORT = 8000
 BASE_DIR = Path(__file__).parent
 TASKS_DIR = BASE_DIR / "tasks"
 PROJECTS_DIR = BASE_DIR / "projects"
+# String forms for per-task paths built with os.path.join, skipping Path objects
+_TASKS_DIR_STR = str(TASKS_DIR)
+_PROJECTS_DIR_STR = str(PROJECTS_DIR)
 IMPLEMENTATIONS_DIR = BASE_DIR / "implementations"
 AGENTS_DIR = BASE_DIR / "agents"
 CONFIG_DIR = BASE_DIR / "config"
 SECURE_CONFIG_FILE = CONFIG_DIR / "secure_config.json"
+MMAP_THRESHOLD = 64 * 1024  # Task files larger than this are parsed from an mmap
 
 # Ensure directories exist
 TASKS_DIR.mkdir(exist_ok=True)
@@ -37,148 +66,198 @@ IMPLEMENTATIONS_DIR.mkdir(exist_ok=True)
 CONFIG_DIR.mkdir(exist_ok=True)
 
 # HTML templates and styling
+# Served once from /static/style.css so browsers can cache it across pages
+STYLE_CSS = """
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, 'Open Sans', 'Helvetica Neue', sans-serif;
+    line-height: 1.6;
+    color: #333;
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 20px;
+    background-color: #f8f9fa;
+}
+h1, h2, h3, h4 {
+    color: #2c3e50;
+}
+.header {
+    background-color: #3498db;
+    color: white;
+    padding: 15px;
+    margin-bottom: 20px;
+    border-radius: 5px;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+.header a {
+    color: white;
+    text-decoration: none;
+    margin-left: 15px;
+}
+.card {
+    background-color: white;
+    border-radius: 5px;
+    box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+    padding: 20px;
+    margin-bottom: 20px;
+}
+table {
+    width: 100%;
+    border-collapse: collapse;
+    margin-bottom: 20px;
+}
+th, td {
+    text-align: left;
+    padding: 12px 15px;
+    border-bottom: 1px solid #e1e1e1;
+}
+th {
+    background-color: #f2f2f2;
+}
+tr:hover {
+    background-color: #f5f5f5;
+}
+.parent-task {
+    background-color: #f8f9fa;
+}
+.subtask {
+    background-color: #fff;
+}
+.subtask td {
+    border-bottom: 1px solid #eee;
+}
+.status {
+    display: inline-block;
+    padding: 4px 8px;
+    border-radius: 3px;
+    font-size: 0.85em;
+}
+.status-not_started {
+    background-color: #e74c3c;
+    color: white;
+}
+.status-in_progress {
+    background-color: #3498db;
+    color: white;
+}
+.status-complete {
+    background-color: #2ecc71;
+    color: white;
+}
+.status-blocked {
+    background-color: #f39c12;
+    color: white;
+}
+.btn {
+    display: inline-block;
+    background-color: #3498db;
+    color: white;
+    padding: 8px 12px;
+    text-decoration: none;
+    border-radius: 4px;
+    border: none;
+    cursor: pointer;
+    font-size: 14px;
+    transition: background-color 0.2s;
+}
+.btn:hover {
+    background-color: #2980b9;
+}
+.btn-success {
+    background-color: #2ecc71;
+}
+.btn-success:hover {
+    background-color: #27ae60;
+}
+.btn-danger {
+    background-color: #e74c3c;
+}
+.btn-danger:hover {
+    background-color: #c0392b;
+}
+.btn-danger:disabled {
+    background-color: #e74c3c;
+    opacity: 0.5;
+    cursor: not-allowed;
+}
+.form-group {
+    margin-bottom: 15px;
+}
+label {
+    display: block;
+    margin-bottom: 5px;
+    font-weight: bold;
+}
+input[type="text"], textarea, select {
+    width: 100%;
+    padding: 8px;
+    border: 1px solid #ddd;
+    border-radius: 4px;
+    box-sizing: border-box;
+}
+textarea {
+    height: 100px;
+}
+.checkbox-cell {
+    text-align: center;
+}
+"""
+
+# Checkbox and bulk delete handling for the task list, served from /static/dashboard.js
+DASHBOARD_JS = """
+// Handle select all checkboxes for each project
+document.querySelectorAll('.project-select-all').forEach(function(checkbox) {
+    checkbox.addEventListener('change', function() {
+        var projectCard = this.closest('.card');
+        var checkboxes = projectCard.querySelectorAll('.task-checkbox');
+        checkboxes.forEach(function(box) {
+            box.checked = checkbox.checked;
+        });
+        updateDeleteButton();
+    });
+});
+
+// Handle individual checkboxes
+document.querySelectorAll('.task-checkbox').forEach(function(checkbox) {
+    checkbox.addEventListener('change', updateDeleteButton);
+});
+
+function updateDeleteButton() {
+    var checkboxes = document.querySelectorAll('.task-checkbox:checked');
+    var deleteButton = document.getElementById('bulk-delete-btn');
+    deleteButton.disabled = checkboxes.length === 0;
+    
+    if (checkboxes.length > 0) {
+        deleteButton.textContent = 'Delete Selected Tasks (' + checkboxes.length + ')';
+    } else {
+        deleteButton.textContent = 'Delete Selected Tasks';
+    }
+}
+
+document.getElementById('bulk-delete-form').addEventListener('submit', function(e) {
+    var checkboxes = document.querySelectorAll('.task-checkbox:checked');
+    
+    if (checkboxes.length === 0) {
+        e.preventDefault();
+        alert('Please select at least one task to delete.');
+        return false;
+    }
+    
+    if (!confirm('Are you sure you want to delete ' + checkboxes.length + ' task(s)? This cannot be undone.')) {
+        e.preventDefault();
+        return false;
+    }
+});
+"""
+
 HTML_HEADER = """
 <!DOCTYPE html>
 <html>
 <head>
     <title>Task Manager</title>
     <meta name="viewport" content="width=device-width, initial-scale=1">
-    <style>
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, 'Open Sans', 'Helvetica Neue', sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f8f9fa;
-        }
-        h1, h2, h3, h4 {
-            color: #2c3e50;
-        }
-        .header {
-            background-color: #3498db;
-            color: white;
-            padding: 15px;
-            margin-bottom: 20px;
-            border-radius: 5px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        .header a {
-            color: white;
-            text-decoration: none;
-            margin-left: 15px;
-        }
-        .card {
-            background-color: white;
-            border-radius: 5px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-            padding: 20px;
-            margin-bottom: 20px;
-        }
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin-bottom: 20px;
-        }
-        th, td {
-            text-align: left;
-            padding: 12px 15px;
-            border-bottom: 1px solid #e1e1e1;
-        }
-        th {
-            background-color: #f2f2f2;
-        }
-        tr:hover {
-            background-color: #f5f5f5;
-        }
-        .parent-task {
-            background-color: #f8f9fa;
-        }
-        .subtask {
-            background-color: #fff;
-        }
-        .subtask td {
-            border-bottom: 1px solid #eee;
-        }
-        .status {
-            display: inline-block;
-            padding: 4px 8px;
-            border-radius: 3px;
-            font-size: 0.85em;
-        }
-        .status-not_started {
-            background-color: #e74c3c;
-            color: white;
-        }
-        .status-in_progress {
-            background-color: #3498db;
-            color: white;
-        }
-        .status-complete {
-            background-color: #2ecc71;
-            color: white;
-        }
-        .status-blocked {
-            background-color: #f39c12;
-            color: white;
-        }
-        .btn {
-            display: inline-block;
-            background-color: #3498db;
-            color: white;
-            padding: 8px 12px;
-            text-decoration: none;
-            border-radius: 4px;
-            border: none;
-            cursor: pointer;
-            font-size: 14px;
-            transition: background-color 0.2s;
-        }
-        .btn:hover {
-            background-color: #2980b9;
-        }
-        .btn-success {
-            background-color: #2ecc71;
-        }
-        .btn-success:hover {
-            background-color: #27ae60;
-        }
-        .btn-danger {
-            background-color: #e74c3c;
-        }
-        .btn-danger:hover {
-            background-color: #c0392b;
-        }
-        .btn-danger:disabled {
-            background-color: #e74c3c;
-            opacity: 0.5;
-            cursor: not-allowed;
-        }
-        .form-group {
-            margin-bottom: 15px;
-        }
-        label {
-            display: block;
-            margin-bottom: 5px;
-            font-weight: bold;
-        }
-        input[type="text"], textarea, select {
-            width: 100%;
-            padding: 8px;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            box-sizing: border-box;
-        }
-        textarea {
-            height: 100px;
-        }
-        .checkbox-cell {
-            text-align: center;
-        }
-    </style>
+    <link rel="stylesheet" href="/static/style.css">
 </head>
 <body>
     <div class="header">
@@ -201,6 +280,33 @@ HTML_FOOTER = """
 </html>
 """
 
+# Badge markup for the statuses the edit form offers, built once
+_STATUS_HTML = {
+    status: f'<span class="status status-{status}">{status}</span>'
+    for status in ("not_started", "in_progress", "complete", "blocked")
+}
+
+def status_badge(status):
+    """Return the escaped status badge markup for a task status"""
+    badge = _STATUS_HTML.get(status)
+    if badge is None:
+        # Status is free text from the forms, so other values are not stored
+        text = escape(status)
+        badge = f'<span class="status status-{text}">{text}</span>'
+    return badge
+
+# Encoded once at import rather than on every response
+HTML_HEADER_BYTES = HTML_HEADER.encode('utf-8')
+HTML_FOOTER_BYTES = HTML_FOOTER.encode('utf-8')
+STYLE_CSS_BYTES = STYLE_CSS.encode('utf-8')
+DASHBOARD_JS_BYTES = DASHBOARD_JS.encode('utf-8')
+
+# Static assets by URL path, as (body, content type)
+STATIC_FILES = {
+    "/static/style.css": (STYLE_CSS_BYTES, 'text/css; charset=utf-8'),
+    "/static/dashboard.js": (DASHBOARD_JS_BYTES, 'text/javascript; charset=utf-8'),
+}
+
 # API Key Management Functions
 class SecureConfigManager:
     """Manages secure storage of API keys and sensitive configuration"""
@@ -325,74 +431,443 @@ class SecureConfigManager:
 # Initialize secure config manager
 secure_config = SecureConfigManager()
 
+# Task summaries and parsed project files keyed by path, as (st_mtime_ns, data).
+# Only files whose modification time changed are re-read on each call.
+_TASK_CACHE = {}
+_PROJECT_CACHE = {}
+_TASK_CACHE_LOCK = threading.Lock()
+
+# Lookups rebuilt whenever the caches above change
+_CHILDREN_INDEX = {}  # Parent task ID to subtask summaries, highest priority first
+_PROJECT_BY_ID = {}  # Project ID to project dict
+
+# Set when files under the tasks or projects directory change. While a watcher is
+# running, a cache that is not stale is served without scanning its directory.
+_CACHE_STALE = {'tasks': True, 'projects': True}
+_cache_watcher = None
+
+# Project index and the feature form <option> list rendered from it, replaced
+# as one tuple so concurrent requests never pair an index with another's HTML
+_PROJECT_OPTIONS_CACHE = (None, '')
+
+def _read_file_bytes(path, size):
+    """
+    Read a whole file whose size is already known from a directory scan.
+    
+    A raw descriptor read sized from the stat result skips the buffered
+    file object and its extra fstat/read-to-EOF syscalls.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Ask for one extra byte so a file that grew since the stat is still read whole
+        data = os.read(fd, size + 1)
+        if len(data) > size:
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+# Task fields shown by the task list views
+TASK_SUMMARY_FIELDS = ("task_id", "description", "status", "priority", "parent_task_id", "project_id")
+
+# A summary field as a top-level key with a scalar value. Task files are written
+# with two-space indentation, so top-level keys are exactly the ones indented by
+# two spaces; nested keys are indented further and newlines inside strings are escaped.
+_SUMMARY_FIELD_RE = re.compile(
+    rb'^  "(' + b"|".join(f.encode() for f in TASK_SUMMARY_FIELDS) + rb')": '
+    rb'("(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|null|true|false)',
+    re.MULTILINE
+)
+
+def extract_summary(buf):
+    """
+    Decode only the task list fields from a task file.
+    
+    Matches the top-level summary keys with a byte-level scan, so the history,
+    code and test results are never turned into Python objects.
+    
+    Args:
+        buf (bytes): Raw task file
+        
+    Returns:
+        dict: The summary fields present in the task
+    """
+    summary = {m.group(1).decode(): loads_bytes(m.group(2)) for m in _SUMMARY_FIELD_RE.finditer(buf)}
+    if "task_id" not in summary:
+        # Not in the two-space indented layout, so parse the whole document
+        data = loads_bytes(buf)
+        summary = {field: data[field] for field in TASK_SUMMARY_FIELDS if field in data}
+    return summary
+
+# Sort key for task summaries, reading the priority normalized at load time
+_BY_PRIORITY = operator.itemgetter('_priority_f')
+
+# Every summary carries all fields, so task list rows unpack their cells
+# with one C-level itemgetter call instead of a chain of dict.get lookups
+_SUMMARY_DEFAULTS = {
+    "task_id": "", "description": "", "status": "", "priority": "",
+    "parent_task_id": None, "project_id": None
+}
+_ROW_FIELDS = operator.itemgetter("task_id", "description", "status", "priority")
+
+def _load_task_summary(buf):
+    """Extract a task summary, fill in missing fields and store its priority as a float for sorting"""
+    summary = {**_SUMMARY_DEFAULTS, **extract_summary(buf)}
+    try:
+        summary['_priority_f'] = float(summary.get('priority') or 0)
+    except (TypeError, ValueError):
+        summary['_priority_f'] = 0.0
+    return summary
+
+# Worker threads loading changed task and project files; file reads release the GIL
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="dashboard-io")
+
+def _parse_file(path, st, parse):
+    """Read and parse one file, returning None if it cannot be loaded"""
+    try:
+        return parse(_read_file_bytes(path, st.st_size))
+    except Exception as e:
+        print(f"Error reading file {path}: {e}")
+        return None
+
+def _load_cached(cache, files, parse=loads_bytes):
+    """
+    Return the parsed JSON files, re-reading only those whose mtime changed.
+    
+    Changed files are loaded concurrently on the I/O pool.
+    
+    Args:
+        cache (dict): Cache to read and update, keyed by path
+        files (list): (path, stat result) pairs to load
+        parse (callable, optional): Parser for the raw file bytes. Defaults to loads_bytes.
+        
+    Returns:
+        tuple: (data, reloaded) with the parsed files in order, skipping unreadable
+            ones, and whether any file had to be read again
+    """
+    results = [None] * len(files)
+    stale = []
+    for i, (path, st) in enumerate(files):
+        cached = cache.get(path)
+        if cached and cached[0] == st.st_mtime_ns:
+            results[i] = cached[1]
+        else:
+            stale.append(i)
+    
+    if len(stale) == 1:
+        loaded = [_parse_file(*files[stale[0]], parse)]
+    else:
+        loaded = _IO_POOL.map(lambda i: _parse_file(*files[i], parse), stale)
+    for i, data in zip(stale, loaded):
+        if data is not None:
+            path, st = files[i]
+            cache[path] = (st.st_mtime_ns, data)
+            results[i] = data
+    
+    return [data for data in results if data is not None], bool(stale)
+
+# Per-task locks serializing read-modify-write of a task file. Entries
+# disappear once no thread holds the lock, so there is no global lock
+# and no unbounded growth.
+_TASK_LOCKS = weakref.WeakValueDictionary()
+_TASK_LOCKS_GUARD = threading.Lock()
+
+def task_lock(task_id):
+    """Return the lock serializing writers of one task file"""
+    with _TASK_LOCKS_GUARD:
+        lock = _TASK_LOCKS.get(task_id)
+        if lock is None:
+            lock = _TASK_LOCKS[task_id] = threading.Lock()
+        return lock
+
+def write_json_atomic(path, data):
+    """
+    Write data as indented JSON so readers see either the old or the new file.
+    
+    The document goes to a temporary file that is synced and then renamed
+    over path, so a crash mid-write cannot leave a truncated file behind.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(dumps_bytes(data, indent=True))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def invalidate_task_cache(task_file):
+    """Drop a task file from the cache after writing it"""
+    with _TASK_CACHE_LOCK:
+        _TASK_CACHE.pop(str(task_file), None)
+        _CACHE_STALE['tasks'] = True
+    # Later reads in this request must see the write too
+    memo = getattr(_request_cache, 'memo', None)
+    if memo:
+        memo.clear()
+
+class _StaleMarker:
+    """watchdog event handler that marks one cache as stale on any change"""
+    
+    def __init__(self, cache_name):
+        self.cache_name = cache_name
+        
+    def dispatch(self, event):
+        _CACHE_STALE[self.cache_name] = True
+
+def start_cache_watcher():
+    """
+    Watch the tasks and projects directories so unchanged caches skip the directory scan.
+    
+    Returns:
+        bool: True if a watcher is running, False if watchdog is not installed
+    """
+    global _cache_watcher
+    if Observer is None:
+        return False
+    if _cache_watcher is None:
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_StaleMarker('tasks'), str(TASKS_DIR), recursive=False)
+        observer.schedule(_StaleMarker('projects'), str(PROJECTS_DIR), recursive=True)
+        observer.start()
+        _cache_watcher = observer
+    return True
+
+# Results of get_all_tasks/get_all_projects/get_agent_status for the HTTP
+# request being served on this thread. A page that needs a listing more
+# than once scans the directory only the first time.
+_request_cache = threading.local()
+
+def begin_request_cache():
+    """Start memoizing directory listings for the request on this thread"""
+    _request_cache.memo = {}
+
+def end_request_cache():
+    """Stop memoizing directory listings on this thread"""
+    _request_cache.memo = None
+
+def request_cached(func):
+    """
+    Memoize a no-argument loader for the rest of the current request.
+    
+    Outside a request (agent threads, scripts) the loader runs every time.
+    """
+    name = func.__name__
+    
+    @functools.wraps(func)
+    def wrapper():
+        memo = getattr(_request_cache, 'memo', None)
+        if memo is None:
+            return func()
+        try:
+            return memo[name]
+        except KeyError:
+            result = memo[name] = func()
+            return result
+    return wrapper
+
 # Data loading functions
+@request_cached
 def get_all_tasks():
-    """Get all tasks from files"""
+    """
+    Get summaries of all tasks, re-reading only files changed since the last call.
+    
+    Only TASK_SUMMARY_FIELDS are decoded; use read_task_data for a full task.
+    """
+    global _CHILDREN_INDEX
+    with _TASK_CACHE_LOCK:
+        if _cache_watcher is not None and not _CACHE_STALE['tasks']:
+            return [task for _, task in _TASK_CACHE.values()]
+        # Cleared before scanning so changes made during the scan mark it stale again
+        _CACHE_STALE['tasks'] = False
+    
     tasks = []
     try:
         if TASKS_DIR.exists():
-            for file in TASKS_DIR.glob("*.json"):
-                try:
-                    with open(file, 'r') as f:
-                        task = json.load(f)
-                        tasks.append(task)
-                except Exception as e:
-                    print(f"Error reading task file {file}: {e}")
+            with _TASK_CACHE_LOCK, os.scandir(TASKS_DIR) as entries:
+                files = []
+                for entry in entries:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    try:
+                        files.append((entry.path, entry.stat()))
+                    except FileNotFoundError:
+                        continue  # Deleted since the directory was listed
+                tasks, changed = _load_cached(_TASK_CACHE, files, _load_task_summary)
+                seen = {path for path, _ in files}
+                
+                # Forget files that have been deleted
+                for path in _TASK_CACHE.keys() - seen:
+                    del _TASK_CACHE[path]
+                    changed = True
+                
+                if changed:
+                    children = {}
+                    for task in tasks:
+                        parent_id = task.get('parent_task_id')
+                        if parent_id:
+                            children.setdefault(parent_id, []).append(task)
+                    for subtasks in children.values():
+                        subtasks.sort(key=_BY_PRIORITY, reverse=True)
+                    _CHILDREN_INDEX = children
     except Exception as e:
+        _CACHE_STALE['tasks'] = True
         print(f"Error accessing tasks directory: {e}")
     return tasks
 
+def _task_file(task_id):
+    """Path of the file holding a task read by read_task_data"""
+    return TASKS_DIR / f"TASK-{task_id}.json"
+
+@functools.lru_cache(maxsize=1024)
+def _read_task_cached(task_id, ino, mtime_ns, size):
+    """
+    Parse a task file, memoized per version of the file.
+    
+    write_json_atomic replaces the file, so every write gets a new inode and
+    a new cache key even within one coarse mtime tick; entries for old
+    versions age out of the LRU.
+    """
+    with open(_task_file(task_id), 'rb') as f:
+        # Parse large files straight from the page cache instead of copying them first
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return loads_bytes(view)
+        return loads_bytes(f.read())
+
 def read_task_data(task_id):
-    """Read data for a specific task"""
+    """Read data for a specific task, re-parsing it only when its file has changed"""
     try:
-        task_file = TASKS_DIR / f"TASK-{task_id}.json"
-        if task_file.exists():
-            with open(task_file, 'r') as f:
-                return json.load(f)
+        st = os.stat(_task_file(task_id))
+        return _read_task_cached(task_id, st.st_ino, st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        pass
     except Exception as e:
         print(f"Error reading task {task_id}: {e}")
     return None
 
+@request_cached
 def get_all_projects():
-    """Get all projects from files"""
+    """Get all projects from files, re-reading only project files changed since the last call"""
+    global _PROJECT_BY_ID
+    with _TASK_CACHE_LOCK:
+        if _cache_watcher is not None and not _CACHE_STALE['projects']:
+            return [project for _, project in _PROJECT_CACHE.values()]
+        # Cleared before scanning so changes made during the scan mark it stale again
+        _CACHE_STALE['projects'] = False
+    
     projects = []
     try:
         if PROJECTS_DIR.exists():
-            project_dirs = [d for d in PROJECTS_DIR.iterdir() if d.is_dir()]
-            for project_dir in project_dirs:
-                project_file = project_dir / "project.json"
-                if project_file.exists():
+            with _TASK_CACHE_LOCK, os.scandir(PROJECTS_DIR) as entries:
+                files = []
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    project_file = os.path.join(entry.path, "project.json")
                     try:
-                        with open(project_file, 'r', encoding='utf-8') as f:
-                            project = json.load(f)
-                            projects.append(project)
-                    except Exception as e:
-                        print(f"Error reading project file {project_file}: {str(e)}")
+                        files.append((project_file, os.stat(project_file)))
+                    except FileNotFoundError:
+                        continue
+                projects, changed = _load_cached(_PROJECT_CACHE, files)
+                seen = {path for path, _ in files}
+                
+                # Forget projects that have been deleted
+                for path in _PROJECT_CACHE.keys() - seen:
+                    del _PROJECT_CACHE[path]
+                    changed = True
+                
+                if changed:
+                    _PROJECT_BY_ID = {p.get('project_id'): p for p in projects}
     except Exception as e:
+        _CACHE_STALE['projects'] = True
         print(f"Error listing projects: {str(e)}")
     
     return projects
 
+def get_project_options_html():
+    """
+    Get the <option> list of all projects for the feature form.
+    
+    The fragment is rendered once per change to the project index, which
+    get_all_projects replaces whenever a project.json changes.
+    """
+    global _PROJECT_OPTIONS_CACHE
+    # Taken before listing, so a concurrent index change can only force an extra render
+    index = _PROJECT_BY_ID
+    projects = get_all_projects()
+    rendered_for, html = _PROJECT_OPTIONS_CACHE
+    if rendered_for is not index:
+        html = "".join(
+            f'<option value="{escape(project.get("project_id", ""))}">{escape(project.get("name", ""))}</option>'
+            for project in projects
+        )
+        _PROJECT_OPTIONS_CACHE = (index, html)
+    return html
+
+def get_children(task_id):
+    """Get the subtasks of a task, highest priority first, from the up-to-date children index"""
+    get_all_tasks()
+    return _CHILDREN_INDEX.get(task_id, [])
+
+def get_project(project_id):
+    """
+    Get a project by ID, or None.
+    
+    Projects are stored in a directory named after their ID, so only that
+    project's file is checked instead of rescanning every project. Projects
+    stored elsewhere are found through the full project index.
+    """
+    global _PROJECT_BY_ID
+    if not project_id:
+        return None
+    
+    if os.path.basename(project_id) == project_id and project_id not in ('.', '..'):
+        project_file = os.path.join(PROJECTS_DIR, project_id, "project.json")
+        try:
+            st = os.stat(project_file)
+        except OSError:
+            pass
+        else:
+            with _TASK_CACHE_LOCK:
+                loaded, reloaded = _load_cached(_PROJECT_CACHE, [(project_file, st)])
+                if loaded and reloaded:
+                    # Publish a new index so anything derived from the old one is rebuilt
+                    _PROJECT_BY_ID = {**_PROJECT_BY_ID, loaded[0].get('project_id'): loaded[0]}
+            if loaded:
+                return loaded[0]
+    
+    get_all_projects()
+    return _PROJECT_BY_ID.get(project_id)
+
+@request_cached
 def get_agent_status():
     """Get status of agents"""
     agents = []
     if AGENTS_DIR.exists():
-        agent_files = [f for f in AGENTS_DIR.glob("*.py") if f.name != "__init__.py"]
-        now = datetime.datetime.now()
+        now_ts = time.time()
+        
+        # DirEntry caches its stat result, so each agent file costs one syscall
+        with os.scandir(AGENTS_DIR) as entries:
+            agent_files = [entry for entry in entries
+                           if entry.name.endswith(".py") and entry.name != "__init__.py"]
         
         for agent_file in agent_files:
             try:
-                # Check if agent file has been modified recently (within 5 minutes)
-                mod_time = datetime.datetime.fromtimestamp(agent_file.stat().st_mtime)
-                time_diff = (now - mod_time).total_seconds() / 60
+                st = agent_file.stat()
                 
                 # Check file size as a simple heuristic for implementation
-                size = agent_file.stat().st_size
+                size = st.st_size
                 
                 agent = {
-                    "name": agent_file.stem,
-                    "active": time_diff < 5,  # Consider active if modified in last 5 minutes
-                    "last_activity": mod_time.isoformat(),
+                    "name": agent_file.name[:-3],
+                    "active": now_ts - st.st_mtime < 300,  # Consider active if modified in last 5 minutes
+                    "last_activity_ts": st.st_mtime,  # Formatted only where it is displayed
                     "size": size,
                     "implemented": size > 1000  # Simple heuristic - non-stub files are typically > 1KB
                 }
@@ -405,8 +880,13 @@ def get_agent_status():
 # HTML generation functions
 def generate_organized_tasks_html(tasks, projects):
     """Generate HTML for tasks organized by project and parent task"""
+    return "".join(iter_organized_tasks_html(tasks, projects))
+
+def iter_organized_tasks_html(tasks, projects):
+    """Yield the HTML for tasks organized by project and parent task, one project card at a time"""
     if not tasks:
-        return "<p>No tasks found</p>"
+        yield "<p>No tasks found</p>"
+        return
     
     # Create project info lookup dict
     project_dict = {p.get('project_id'): p for p in projects}
@@ -420,7 +900,7 @@ def generate_organized_tasks_html(tasks, projects):
         tasks_by_project[project_id].append(task)
     
     # Generate HTML for each project
-    html = """
+    yield """
     <form action="/bulk_delete" method="post" id="bulk-delete-form">
     <button type="submit" class="btn btn-danger" id="bulk-delete-btn" disabled style="margin-bottom: 20px;">
         Delete Selected Tasks
@@ -438,30 +918,22 @@ def generate_organized_tasks_html(tasks, projects):
         project_name = project.get('name', 'Unknown Project')
         project_tasks = tasks_by_project[project_id]
         
-        # Group tasks by parent task
+        # Subtasks are listed under their parent from the children index
         root_tasks = [t for t in project_tasks if not t.get('parent_task_id')]
-        tasks_by_parent = {}
-        subtasks = [t for t in project_tasks if t.get('parent_task_id')]
-        
-        for task in subtasks:
-            parent_id = task.get('parent_task_id')
-            if parent_id not in tasks_by_parent:
-                tasks_by_parent[parent_id] = []
-            tasks_by_parent[parent_id].append(task)
         
         # Start project section
-        html += f"""
+        parts = [f"""
         <div class="card" style="margin-bottom: 20px;">
             <h3>
                 <a href="/project?project_id={project_id}" style="text-decoration: none;">
-                    {project_name}
+                    {escape(project_name)}
                 </a>
             </h3>
-        """
+        """]
         
         # Table for root tasks
         if root_tasks:
-            html += """
+            parts.append("""
             <table style="width: 100%;">
                 <tr>
                     <th style="width: 30px;"><input type="checkbox" class="project-select-all"></th>
@@ -471,141 +943,77 @@ def generate_organized_tasks_html(tasks, projects):
                     <th style="width: 80px;">Priority</th>
                     <th style="width: 100px;">Actions</th>
                 </tr>
-            """
+            """)
             
             # Sort root tasks by priority (higher first)
-            sorted_root_tasks = sorted(root_tasks, key=lambda t: float(t.get('priority', 0)), reverse=True)
+            sorted_root_tasks = sorted(root_tasks, key=_BY_PRIORITY, reverse=True)
             
             for task in sorted_root_tasks:
-                task_id = task.get('task_id', '')
-                description = task.get('description', '')
-                status = task.get('status', '')
-                priority = task.get('priority', '')
-                has_subtasks = task_id in tasks_by_parent
+                task_id, description, status, priority = _ROW_FIELDS(task)
+                sorted_subtasks = _CHILDREN_INDEX.get(task_id)
+                has_subtasks = bool(sorted_subtasks)
                 
-                # Determine status class
-                status_class = f"status-{status}" if status else ""
                 
                 # Generate root task row
-                html += f"""
+                parts.append(f"""
                 <tr class="parent-task">
                     <td><input type="checkbox" name="selected_tasks" value="{task_id}" class="task-checkbox"></td>
                     <td>{task_id}</td>
                     <td>
-                        <a href="/view?task_id={task_id}">{description}</a>
+                        <a href="/view?task_id={task_id}">{escape(description)}</a>
                         {' <span style="color: #888;">(has subtasks)</span>' if has_subtasks else ''}
                     </td>
-                    <td><span class="status {status_class}">{status}</span></td>
-                    <td>{priority}</td>
+                    <td>{status_badge(status)}</td>
+                    <td>{escape(priority)}</td>
                     <td>
                         <a href="/view?task_id={task_id}" class="btn">View</a>
                     </td>
                 </tr>
-                """
+                """)
                 
                 # Add subtasks with indentation
                 if has_subtasks:
-                    # Sort subtasks by priority
-                    sorted_subtasks = sorted(tasks_by_parent[task_id], key=lambda t: float(t.get('priority', 0)), reverse=True)
-                    
                     for subtask in sorted_subtasks:
-                        subtask_id = subtask.get('task_id', '')
-                        subtask_desc = subtask.get('description', '')
-                        subtask_status = subtask.get('status', '')
-                        subtask_priority = subtask.get('priority', '')
+                        subtask_id, subtask_desc, subtask_status, subtask_priority = _ROW_FIELDS(subtask)
                         
-                        # Determine status class
-                        subtask_status_class = f"status-{subtask_status}" if subtask_status else ""
                         
                         # Generate subtask row with indentation
-                        html += f"""
+                        parts.append(f"""
                         <tr class="subtask">
                             <td><input type="checkbox" name="selected_tasks" value="{subtask_id}" class="task-checkbox"></td>
                             <td>{subtask_id}</td>
                             <td style="padding-left: 20px;">
-                                <span style="color: #666;">↳</span> <a href="/view?task_id={subtask_id}">{subtask_desc}</a>
+                                <span style="color: #666;">↳</span> <a href="/view?task_id={subtask_id}">{escape(subtask_desc)}</a>
                             </td>
-                            <td><span class="status {subtask_status_class}">{subtask_status}</span></td>
-                            <td>{subtask_priority}</td>
+                            <td>{status_badge(subtask_status)}</td>
+                            <td>{escape(subtask_priority)}</td>
                             <td>
                                 <a href="/view?task_id={subtask_id}" class="btn">View</a>
                             </td>
                         </tr>
-                        """
+                        """)
             
-            html += "</table>"
+            parts.append("</table>")
         else:
-            html += "<p>No tasks in this project</p>"
+            parts.append("<p>No tasks in this project</p>")
         
-        html += """
+        parts.append("""
         <div style="margin-top: 10px;">
             <a href="/feature_form" class="btn btn-success">Add Feature</a>
         </div>
         </div>
-        """
-    
-    # Add JavaScript for checkbox handling
-    html += """
-    <script>
-    // Handle select all checkboxes for each project
-    document.querySelectorAll('.project-select-all').forEach(function(checkbox) {
-        checkbox.addEventListener('change', function() {
-            var projectCard = this.closest('.card');
-            var checkboxes = projectCard.querySelectorAll('.task-checkbox');
-            checkboxes.forEach(function(box) {
-                box.checked = checkbox.checked;
-            });
-            updateDeleteButton();
-        });
-    });
-    
-    // Handle individual checkboxes
-    document.querySelectorAll('.task-checkbox').forEach(function(checkbox) {
-        checkbox.addEventListener('change', updateDeleteButton);
-    });
+        """)
+        yield "".join(parts)
     
-    function updateDeleteButton() {
-        var checkboxes = document.querySelectorAll('.task-checkbox:checked');
-        var deleteButton = document.getElementById('bulk-delete-btn');
-        deleteButton.disabled = checkboxes.length === 0;
-        
-        if (checkboxes.length > 0) {
-            deleteButton.textContent = 'Delete Selected Tasks (' + checkboxes.length + ')';
-        } else {
-            deleteButton.textContent = 'Delete Selected Tasks';
-        }
-    }
-    
-    document.getElementById('bulk-delete-form').addEventListener('submit', function(e) {
-        var checkboxes = document.querySelectorAll('.task-checkbox:checked');
-        
-        if (checkboxes.length === 0) {
-            e.preventDefault();
-            alert('Please select at least one task to delete.');
-            return false;
-        }
-        
-        if (!confirm('Are you sure you want to delete ' + checkboxes.length + ' task(s)? This cannot be undone.')) {
-            e.preventDefault();
-            return false;
-        }
-    });
-    </script>
+    # Checkbox handling is served from /static/dashboard.js so browsers can cache it
+    yield """
+    <script src="/static/dashboard.js" defer></script>
     </form>
     """
-    
-    return html
 
 def generate_new_feature_form():
     """Generate HTML for the feature request form"""
-    # Get all projects for the dropdown
-    projects = get_all_projects()
-    
-    project_options = ""
-    for project in projects:
-        project_id = project.get('project_id', '')
-        project_name = project.get('name', '')
-        project_options += f'<option value="{project_id}">{project_name}</option>'
+    project_options = get_project_options_html()
     
     html = """
     <div class="card">
@@ -661,29 +1069,19 @@ def generate_task_view_html(task_id):
     if parent_task_id:
         parent_task = read_task_data(parent_task_id)
     
-    # Get subtasks if any exist
-    subtasks = []
-    all_tasks = get_all_tasks()
-    for t in all_tasks:
-        if t.get('parent_task_id') == task_id:
-            subtasks.append(t)
-    
-    # Sort subtasks by priority
-    subtasks = sorted(subtasks, key=lambda t: float(t.get('priority', 0)), reverse=True)
+    # Get subtasks if any exist, sorted by priority
+    subtasks = get_children(task_id)
     
     # Get project info
     project_id = task.get('project_id')
     project_name = "Unknown Project"
     if project_id:
-        all_projects = get_all_projects()
-        for p in all_projects:
-            if p.get('project_id') == project_id:
-                project_name = p.get('name', 'Unknown Project')
-                break
+        project = get_project(project_id)
+        if project:
+            project_name = project.get('name', 'Unknown Project')
     
     # Determine status class
     status = task.get('status', '')
-    status_class = f"status-{status}" if status else ""
     
     # Format dates
     created_at = task.get('created_at', '')
@@ -705,15 +1103,15 @@ def generate_task_view_html(task_id):
     
     html = f"""
     <div class="card">
-        <h2>Task: {task.get('description', 'No Description')}</h2>
+        <h2>Task: {escape(task.get('description', 'No Description'))}</h2>
         
         <div class="task-metadata">
             <p><strong>Task ID:</strong> {task_id}</p>
-            <p><strong>Status:</strong> <span class="status {status_class}">{status}</span></p>
-            <p><strong>Priority:</strong> {task.get('priority', 'Not set')}</p>
-            <p><strong>Project:</strong> <a href="/project?project_id={project_id}">{project_name}</a></p>
+            <p><strong>Status:</strong> {status_badge(status)}</p>
+            <p><strong>Priority:</strong> {escape(task.get('priority', 'Not set'))}</p>
+            <p><strong>Project:</strong> <a href="/project?project_id={project_id}">{escape(project_name)}</a></p>
             
-            {f'<p><strong>Parent Task:</strong> <a href="/view?task_id={parent_task_id}">{parent_task.get("description", "Unknown")}</a></p>' if parent_task else ''}
+            {f'<p><strong>Parent Task:</strong> <a href="/view?task_id={parent_task_id}">{escape(parent_task.get("description", "Unknown"))}</a></p>' if parent_task else ''}
             
             <p><strong>Created:</strong> {created_at}</p>
             <p><strong>Last Updated:</strong> {updated_at}</p>
@@ -722,7 +1120,7 @@ def generate_task_view_html(task_id):
         
         <div class="task-content">
             <h3>Details</h3>
-            <pre>{task.get('details', task.get('requirements', ['No details provided'])[0] if task.get('requirements') else 'No details provided')}</pre>
+            <pre>{escape(task.get('details', task.get('requirements', ['No details provided'])[0] if task.get('requirements') else 'No details provided'))}</pre>
         </div>
         
         <div class="task-actions" style="margin-top: 20px;">
@@ -788,20 +1186,15 @@ def generate_subtasks_section(subtasks):
     """
     
     for task in subtasks:
-        task_id = task.get('task_id', '')
-        description = task.get('description', '')
-        status = task.get('status', '')
-        priority = task.get('priority', '')
+        task_id, description, status, priority = _ROW_FIELDS(task)
         
-        # Determine status class
-        status_class = f"status-{status}" if status else ""
         
         html += f"""
         <tr>
             <td>{task_id}</td>
-            <td><a href="/view?task_id={task_id}">{description}</a></td>
-            <td><span class="status {status_class}">{status}</span></td>
-            <td>{priority}</td>
+            <td><a href="/view?task_id={task_id}">{escape(description)}</a></td>
+            <td>{status_badge(status)}</td>
+            <td>{escape(priority)}</td>
             <td>
                 <a href="/view?task_id={task_id}" class="btn">View</a>
             </td>
@@ -821,7 +1214,7 @@ def generate_task_details_html(task_id, tasks, projects):
     
     # Get project info if available
     project_id = task.get('project_id')
-    project = next((p for p in projects if p.get('project_id') == project_id), None)
+    project = get_project(project_id)
     project_name = project.get('name', 'Unknown') if project else 'Unknown'
     
     # Generate details
@@ -834,23 +1227,23 @@ def generate_task_details_html(task_id, tasks, projects):
     
     # History entries
     history = task.get('history', [])
-    history_html = ""
+    history_parts = []
     if history:
-        history_html += "<h3>History</h3><ul>"
+        history_parts.append("<h3>History</h3><ul>")
         for entry in history:
             timestamp = entry.get('timestamp', '')
             status = entry.get('status', '')
             message = entry.get('message', '')
-            history_html += f"<li><strong>{timestamp}</strong>: {status} - {message}</li>"
-        history_html += "</ul>"
+            history_parts.append(f"<li><strong>{timestamp}</strong>: {status} - {message}</li>")
+        history_parts.append("</ul>")
     
     # Code files
     code = task.get('code', {})
     code_files = code.get('files', [])
-    code_html = "<h3>Code Files</h3>"
+    code_parts = ["<h3>Code Files</h3>"]
     
     if code_files:
-        code_html += "<ul>"
+        code_parts.append("<ul>")
         for file_item in code_files:
             # Handle both simple file paths and complex objects with path and content
             if isinstance(file_item, dict):
@@ -877,51 +1270,51 @@ def generate_task_details_html(task_id, tasks, projects):
                     content_preview = f"Error reading file: {str(e)}"
             
             file_name = os.path.basename(file_path)
-            code_html += f"""
+            code_parts.append(f"""
             <li>
                 <strong>{file_name}</strong> ({file_path})
                 <div class="code-block">{content_preview}</div>
             </li>
-            """
-        code_html += "</ul>"
+            """)
+        code_parts.append("</ul>")
     else:
-        code_html += "<p>No code files associated with this task</p>"
+        code_parts.append("<p>No code files associated with this task</p>")
         # Add button to trigger agent if no code files
-        code_html += f"""
+        code_parts.append(f"""
         <p>
             <a href="/trigger_agent?task_id={task_id}" class="btn btn-success">
                 Trigger Agent Processing
             </a>
         </p>
-        """
+        """)
     
     # Test results
     test_results = task.get('test_results')
-    test_html = "<h3>Test Results</h3>"
+    test_parts = ["<h3>Test Results</h3>"]
     if test_results:
         passed = test_results.get('passed', False)
         status = "Passed" if passed else "Failed"
         details = test_results.get('details', [])
         
-        test_html += f"<p><strong>Status:</strong> {status}</p>"
+        test_parts.append(f"<p><strong>Status:</strong> {status}</p>")
         
         if details:
-            test_html += "<ul>"
+            test_parts.append("<ul>")
             for detail in details:
-                test_html += f"<li>{detail}</li>"
-            test_html += "</ul>"
+                test_parts.append(f"<li>{detail}</li>")
+            test_parts.append("</ul>")
     else:
-        test_html += "<p>No test results available</p>"
+        test_parts.append("<p>No test results available</p>")
     
     # Put it all together
     html = f"""
     <div class="card">
         <h2>Task Details: {task_id}</h2>
-        <p><strong>Description:</strong> {description}</p>
-        <p><strong>Status:</strong> <span class="status status-{status}">{status}</span></p>
-        <p><strong>Priority:</strong> {priority}</p>
+        <p><strong>Description:</strong> {escape(description)}</p>
+        <p><strong>Status:</strong> {status_badge(status)}</p>
+        <p><strong>Priority:</strong> {escape(priority)}</p>
         <p><strong>Language:</strong> {language}</p>
-        <p><strong>Project:</strong> <a href="/project?project_id={project_id}">{project_name}</a></p>
+        <p><strong>Project:</strong> <a href="/project?project_id={project_id}">{escape(project_name)}</a></p>
         <p><strong>Created:</strong> {created_at}</p>
         <p><strong>Updated:</strong> {updated_at}</p>
         
@@ -933,9 +1326,9 @@ def generate_task_details_html(task_id, tasks, projects):
         </p>
     </div>
     
-    {history_html}
-    {code_html}
-    {test_html}
+    {''.join(history_parts)}
+    {''.join(code_parts)}
+    {''.join(test_parts)}
     """
     
     return html
@@ -945,29 +1338,29 @@ def trigger_agent_processing(task_id):
     task_file = TASKS_DIR / f"{task_id}.json"
     if task_file.exists():
         try:
-            with open(task_file, 'r', encoding='utf-8') as f:
-                task = json.load(f)
-            
-            # Add a history entry for agent triggering
-            if 'history' not in task:
-                task['history'] = []
+            with task_lock(task_id):
+                task = loads_bytes(task_file.read_bytes())
                 
-            timestamp = datetime.datetime.now().isoformat()
-            task['history'].append({
-                "timestamp": timestamp,
-                "status": "implementing",
-                "message": "Agent processing manually triggered"
-            })
-            
-            # Update status to implementing (matches TaskStatus enum in models/task.py)
-            task['status'] = "implementing"
-            task['updated_at'] = timestamp
-            
-            with open(task_file, 'w', encoding='utf-8') as f:
-                json.dump(task, f, indent=2)
+                # Add a history entry for agent triggering
+                if 'history' not in task:
+                    task['history'] = []
+                    
+                timestamp = datetime.datetime.now().isoformat()
+                task['history'].append({
+                    "timestamp": timestamp,
+                    "status": "implementing",
+                    "message": "Agent processing manually triggered"
+                })
+                
+                # Update status to implementing (matches TaskStatus enum in models/task.py)
+                task['status'] = "implementing"
+                task['updated_at'] = timestamp
+                
+                write_json_atomic(task_file, task)
+            invalidate_task_cache(task_file)
             
-            # Start agent processing in a separate thread to avoid blocking
-            threading.Thread(target=process_task_with_agent, args=(task_id,), daemon=True).start()
+            # Hand agent processing to the worker pool to avoid blocking
+            _agent_pool.submit(process_task_with_agent, task_id)
             print(f"Triggered agent processing for task {task_id}")
             
             return True
@@ -976,18 +1369,44 @@ def trigger_agent_processing(task_id):
     
     return False
 
+# Workers handing triggered tasks to the orchestrator, bounding the threads a burst of triggers can start
+_agent_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="agent")
+
+# Orchestrator shared by every triggered task, created and started on first use
+_orchestrator = None
+_orchestrator_lock = threading.Lock()
+
+def get_orchestrator():
+    """
+    Get the running orchestrator, creating and starting it on first call.
+    
+    Building an orchestrator loads every project and task, so one instance
+    and its processing queue are shared by all triggers.
+    """
+    global _orchestrator
+    orchestrator = _orchestrator
+    if orchestrator is None:
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                # Import the OrchestratorAgent here to avoid circular imports
+                from agents.orchestration_agent import OrchestratorAgent
+                
+                # Initialize the orchestrator with the current directory
+                orchestrator = OrchestratorAgent(str(BASE_DIR))
+                orchestrator.start()
+                _orchestrator = orchestrator
+            orchestrator = _orchestrator
+    return orchestrator
+
 def process_task_with_agent(task_id):
     """Process a task using the orchestration agent API directly"""
     try:
-        # Import the OrchestratorAgent here to avoid circular imports
-        from agents.orchestration_agent import OrchestratorAgent
-        import os
+        orchestrator = get_orchestrator()
         
-        # Initialize the orchestrator with the current directory
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        orchestrator = OrchestratorAgent(base_path)
-        
-        # Load the task
+        # The dashboard has just rewritten the task file, so drop any copy
+        # the orchestrator loaded earlier and read it again
+        with orchestrator.tasks_lock:
+            orchestrator.tasks.pop(task_id, None)
         task = orchestrator.get_task(task_id)
         
         if task:
@@ -999,10 +1418,6 @@ def process_task_with_agent(task_id):
                 priority_value = 100 - float(task.priority)
                 orchestrator.task_queue.put((priority_value, task_id))
             
-            # Start processing if not already running
-            if not orchestrator.running:
-                orchestrator.start()
-                
             print(f"Task {task_id} added to processing queue with priority {priority_value}")
         else:
             print(f"Task {task_id} not found in orchestrator tasks - may need to restart the orchestration agent")
@@ -1013,18 +1428,63 @@ def process_task_with_agent(task_id):
         import traceback
         traceback.print_exc()
 
+# Row markup for the project, agent status and bulk delete pages, filled
+# with one format_map call per row from an already escaped context
+_PARENT_ROW_TMPL = """
+            <tr class="parent-task">
+                <td>{task_id}</td>
+                <td>
+                    <a href="/view?task_id={task_id}">{description}</a>
+                    {subtasks_note}
+                </td>
+                <td>{status}</td>
+                <td>{priority}</td>
+                <td>
+                    <a href="/view?task_id={task_id}" class="btn">View</a>
+                </td>
+            </tr>
+            """
+_SUBTASK_ROW_TMPL = """
+                    <tr class="subtask">
+                        <td>{task_id}</td>
+                        <td style="padding-left: 20px;">
+                            <span style="color: #666;">↳</span> <a href="/view?task_id={task_id}">{description}</a>
+                        </td>
+                        <td>{status}</td>
+                        <td>{priority}</td>
+                        <td>
+                            <a href="/view?task_id={task_id}" class="btn">View</a>
+                        </td>
+                    </tr>
+                    """
+_AGENT_ROW_TMPL = """
+        <tr>
+            <td>{name}</td>
+            <td><span class="agent-status {status_class}"></span> {status_text}</td>
+            <td>{last_activity}</td>
+            <td>{size} bytes</td>
+        </tr>
+        """
+_BULK_ROW_TMPL = """
+        <tr>
+            <td>{task_id}</td>
+            <td>{description}</td>
+        </tr>
+        """
+_SUBTASKS_NOTE = ' <span style="color: #888;">(has subtasks)</span>'
+
+def _row_context(task, subtasks_note=''):
+    """Template context for one task row, with the description escaped and the status rendered"""
+    task_id, description, status, priority = _ROW_FIELDS(task)
+    return {
+        'task_id': escape(task_id), 'description': escape(description),
+        'status': status_badge(status), 'priority': escape(priority),
+        'subtasks_note': subtasks_note
+    }
+
 def generate_project_view_html(project_id):
     """Generate HTML for a project view"""
-    # Get all projects
-    all_projects = get_all_projects()
-    
-    # Find the current project
-    project = None
-    for p in all_projects:
-        if p.get('project_id') == project_id:
-            project = p
-            break
-    
+    project = get_project(project_id)
     if not project:
         return "<p>Project not found</p>"
     
@@ -1032,37 +1492,29 @@ def generate_project_view_html(project_id):
     all_tasks = get_all_tasks()
     project_tasks = [t for t in all_tasks if t.get('project_id') == project_id]
     
-    # Organize tasks by parent/child relationships
+    # Subtasks are listed under their parent from the children index
     root_tasks = [t for t in project_tasks if not t.get('parent_task_id')]
-    tasks_by_parent = {}
     
-    for task in project_tasks:
-        parent_id = task.get('parent_task_id')
-        if parent_id:
-            if parent_id not in tasks_by_parent:
-                tasks_by_parent[parent_id] = []
-            tasks_by_parent[parent_id].append(task)
-    
-    html = f"""
+    parts = [f"""
     <div class="card">
-        <h2>Project: {project.get('name', 'Unnamed Project')}</h2>
+        <h2>Project: {escape(project.get('name', 'Unnamed Project'))}</h2>
         
         <div class="project-metadata">
-            <p><strong>Project ID:</strong> {project_id}</p>
-            <p><strong>Description:</strong> {project.get('description', 'No description')}</p>
+            <p><strong>Project ID:</strong> {escape(project_id)}</p>
+            <p><strong>Description:</strong> {escape(project.get('description', 'No description'))}</p>
         </div>
         
         <div style="margin-top: 20px;">
-            <a href="/feature_form?project_id={project_id}" class="btn btn-success">Add Feature</a>
+            <a href="/feature_form?project_id={escape(project_id)}" class="btn btn-success">Add Feature</a>
             <a href="/" class="btn">Back to Dashboard</a>
         </div>
         
         <div style="margin-top: 20px;">
             <h3>Tasks</h3>
-    """
+    """]
     
     if project_tasks:
-        html += """
+        parts.append("""
         <table style="width: 100%;">
             <tr>
                 <th style="width: 120px;">Task ID</th>
@@ -1071,85 +1523,38 @@ def generate_project_view_html(project_id):
                 <th style="width: 80px;">Priority</th>
                 <th style="width: 100px;">Actions</th>
             </tr>
-        """
+        """)
         
         # Sort root tasks by priority
-        root_tasks = sorted(root_tasks, key=lambda t: float(t.get('priority', 0)), reverse=True)
+        root_tasks = sorted(root_tasks, key=_BY_PRIORITY, reverse=True)
         
         for task in root_tasks:
-            task_id = task.get('task_id', '')
-            description = task.get('description', '')
-            status = task.get('status', '')
-            priority = task.get('priority', '')
-            has_subtasks = task_id in tasks_by_parent
-            
-            # Determine status class
-            status_class = f"status-{status}" if status else ""
-            
-            html += f"""
-            <tr class="parent-task">
-                <td>{task_id}</td>
-                <td>
-                    <a href="/view?task_id={task_id}">{description}</a>
-                    {' <span style="color: #888;">(has subtasks)</span>' if has_subtasks else ''}
-                </td>
-                <td><span class="status {status_class}">{status}</span></td>
-                <td>{priority}</td>
-                <td>
-                    <a href="/view?task_id={task_id}" class="btn">View</a>
-                </td>
-            </tr>
-            """
+            subtasks = _CHILDREN_INDEX.get(task['task_id'])
+            parts.append(_PARENT_ROW_TMPL.format_map(_row_context(task, _SUBTASKS_NOTE if subtasks else '')))
             
             # Add subtasks if they exist
-            if has_subtasks:
-                subtasks = sorted(tasks_by_parent[task_id], key=lambda t: float(t.get('priority', 0)), reverse=True)
-                
-                for subtask in subtasks:
-                    subtask_id = subtask.get('task_id', '')
-                    subtask_desc = subtask.get('description', '')
-                    subtask_status = subtask.get('status', '')
-                    subtask_priority = subtask.get('priority', '')
-                    
-                    # Determine status class
-                    subtask_status_class = f"status-{subtask_status}" if subtask_status else ""
-                    
-                    html += f"""
-                    <tr class="subtask">
-                        <td>{subtask_id}</td>
-                        <td style="padding-left: 20px;">
-                            <span style="color: #666;">↳</span> <a href="/view?task_id={subtask_id}">{subtask_desc}</a>
-                        </td>
-                        <td><span class="status {subtask_status_class}">{subtask_status}</span></td>
-                        <td>{subtask_priority}</td>
-                        <td>
-                            <a href="/view?task_id={subtask_id}" class="btn">View</a>
-                        </td>
-                    </tr>
-                    """
+            if subtasks:
+                parts.extend(_SUBTASK_ROW_TMPL.format_map(_row_context(subtask)) for subtask in subtasks)
         
-        html += "</table>"
+        parts.append("</table>")
     else:
-        html += "<p>No tasks in this project</p>"
+        parts.append("<p>No tasks in this project</p>")
     
-    html += """
+    parts.append("""
         </div>
     </div>
-    """
+    """)
     
-    return html
+    return "".join(parts)
 
 def generate_agent_status_html():
     """Generate HTML for agent status dashboard"""
     agents = get_agent_status()
     
-    html = "<h2>Agent Status</h2>"
-    
     if not agents:
-        html += "<p>No agents found</p>"
-        return html
+        return "<h2>Agent Status</h2><p>No agents found</p>"
     
-    html += """
+    parts = ["""<h2>Agent Status</h2>
     <table>
         <tr>
             <th>Agent</th>
@@ -1157,37 +1562,32 @@ def generate_agent_status_html():
             <th>Last Activity</th>
             <th>Size</th>
         </tr>
-    """
+    """]
     
     for agent in agents:
-        name = agent.get('name', 'Unknown')
-        active = agent.get('active', False)
-        last_activity = agent.get('last_activity', 'Unknown')
-        size = agent.get('size', 0)
-        implemented = agent.get('implemented', False)
+        last_activity_ts = agent.get('last_activity_ts')
         
         # Determine status
-        if active:
+        if agent.get('active', False):
             status_class = "agent-active"
             status_text = "Active"
-        elif implemented:
+        elif agent.get('implemented', False):
             status_class = "agent-inactive"
             status_text = "Inactive"
         else:
             status_class = "agent-unknown"
             status_text = "Not Implemented"
         
-        html += f"""
-        <tr>
-            <td>{name}</td>
-            <td><span class="agent-status {status_class}"></span> {status_text}</td>
-            <td>{last_activity}</td>
-            <td>{size} bytes</td>
-        </tr>
-        """
+        parts.append(_AGENT_ROW_TMPL.format_map({
+            'name': agent.get('name', 'Unknown'),
+            'status_class': status_class,
+            'status_text': status_text,
+            'last_activity': datetime.datetime.fromtimestamp(last_activity_ts).isoformat() if last_activity_ts else 'Unknown',
+            'size': agent.get('size', 0)
+        }))
     
-    html += "</table>"
-    return html
+    parts.append("</table>")
+    return "".join(parts)
 
 def delete_tasks(task_ids):
     """Delete multiple tasks"""
@@ -1200,14 +1600,14 @@ def delete_tasks(task_ids):
     
     deleted_count = 0
     for task_id in task_ids:
-        task_file = TASKS_DIR / f"{task_id}.json"
-        if task_file.exists():
-            try:
-                task_file.unlink()
-                deleted_count += 1
-                print(f"Deleted task {task_id}")
-            except Exception as e:
-                print(f"Error deleting task {task_id}: {str(e)}")
+        try:
+            os.unlink(os.path.join(_TASKS_DIR_STR, task_id + ".json"))
+            deleted_count += 1
+            print(f"Deleted task {task_id}")
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            print(f"Error deleting task {task_id}: {str(e)}")
     
     return deleted_count
 
@@ -1227,22 +1627,22 @@ def generate_edit_task_form(task_id):
         project_id = project.get('project_id', '')
         project_name = project.get('name', '')
         selected = 'selected' if project_id == current_project_id else ''
-        project_options += f'<option value="{project_id}" {selected}>{project_name}</option>'
+        project_options += f'<option value="{escape(project_id)}" {selected}>{escape(project_name)}</option>'
     
     html = f"""
     <div class="card">
         <h2>Edit Task</h2>
         <form action="/update_task" method="post">
-            <input type="hidden" name="task_id" value="{task_id}">
+            <input type="hidden" name="task_id" value="{escape(task_id)}">
             
             <div class="form-group">
                 <label for="description">Description:</label>
-                <input type="text" id="description" name="description" value="{task.get('description', '')}" required>
+                <input type="text" id="description" name="description" value="{escape(task.get('description', ''))}" required>
             </div>
             
             <div class="form-group">
                 <label for="details">Details:</label>
-                <textarea id="details" name="details">{task.get('details', '')}</textarea>
+                <textarea id="details" name="details">{escape(task.get('details', ''))}</textarea>
             </div>
             
             <div class="form-group">
@@ -1274,11 +1674,11 @@ def generate_edit_task_form(task_id):
             
             <div class="form-group">
                 <label for="due_date">Due Date (optional):</label>
-                <input type="date" id="due_date" name="due_date" value="{task.get('due_date', '')}">
+                <input type="date" id="due_date" name="due_date" value="{escape(task.get('due_date', ''))}">
             </div>
             
             <button type="submit" class="btn btn-success">Update Task</button>
-            <a href="/view?task_id={task_id}" class="btn">Cancel</a>
+            <a href="/view?task_id={escape(task_id)}" class="btn">Cancel</a>
         </form>
     </div>
     """
@@ -1293,18 +1693,19 @@ def update_task(task_id, updated_data):
         return False
     
     try:
-        # Read existing task data
-        with open(task_file, 'r') as f:
-            task_data = json.load(f)
-        
-        # Update task data with new values
-        for key, value in updated_data.items():
-            if value or value == 0:  # Update if value is not empty
-                task_data[key] = value
-        
-        # Write updated data back to file
-        with open(task_file, 'w') as f:
-            json.dump(task_data, f, indent=2)
+        with task_lock(task_id):
+            # Read existing task data
+            with open(task_file, 'rb') as f:
+                task_data = loads_bytes(f.read())
+            
+            # Update task data with new values
+            for key, value in updated_data.items():
+                if value or value == 0:  # Update if value is not empty
+                    task_data[key] = value
+            
+            # Write updated data back to file
+            write_json_atomic(task_file, task_data)
+        invalidate_task_cache(task_file)
         
         return True
     except Exception as e:
@@ -1322,17 +1723,15 @@ def generate_bulk_delete_confirmation_html(selected_tasks):
         </div>
         """
     
-    # Get task data for each task ID
-    task_data = []
-    for task_id in selected_tasks:
-        task = read_task_data(task_id)
-        if task:
-            task_data.append({
-                'task_id': task_id,
-                'description': task.get('description', 'No description')
-            })
+    # Only descriptions are shown, so take them from the cached task
+    # summaries instead of opening and parsing each selected task file
+    tasks_by_id = {t['task_id']: t for t in get_all_tasks()}
+    task_data = [
+        {'task_id': escape(task_id), 'description': escape(tasks_by_id[task_id]['description'] or 'No description')}
+        for task_id in selected_tasks if task_id in tasks_by_id
+    ]
     
-    html = """
+    parts = ["""
     <div class="card">
         <h2>Confirm Deletion</h2>
         <p>Are you sure you want to delete the following tasks? This action cannot be undone.</p>
@@ -1342,36 +1741,29 @@ def generate_bulk_delete_confirmation_html(selected_tasks):
                 <th style="width: 120px;">Task ID</th>
                 <th>Description</th>
             </tr>
-    """
+    """]
     
-    for task in task_data:
-        html += f"""
-        <tr>
-            <td>{task['task_id']}</td>
-            <td>{task['description']}</td>
-        </tr>
-        """
+    parts.extend(_BULK_ROW_TMPL.format_map(task) for task in task_data)
     
-    html += """
+    parts.append("""
         </table>
         
         <div style="margin-top: 20px;">
             <form action="/confirm_delete" method="post">
-    """
+    """)
     
     # Add hidden inputs for each task ID
-    for task_id in selected_tasks:
-        html += f'<input type="hidden" name="confirm_tasks" value="{task_id}">'
+    parts.extend(f'<input type="hidden" name="confirm_tasks" value="{escape(task_id)}">' for task_id in selected_tasks)
     
-    html += """
+    parts.append("""
                 <button type="submit" class="btn btn-danger">Confirm Delete</button>
                 <a href="/" class="btn">Cancel</a>
             </form>
         </div>
     </div>
-    """
+    """)
     
-    return html
+    return "".join(parts)
 
 def generate_api_key_settings_html():
     """Generate HTML for API key settings page"""
@@ -2327,7 +2719,30 @@ def generate_prompt_analytics():
 
 def get_html_page(page_name, **kwargs):
     """Return HTML for specified page"""
-    html = HTML_HEADER
+    return HTML_HEADER + get_page_body(page_name, **kwargs) + HTML_FOOTER
+
+def iter_html_page(page_name, **kwargs):
+    """
+    Yield the encoded page in pieces, streaming the task list on the home page.
+    
+    Args:
+        page_name (str): Page to render, as for get_html_page
+        
+    Yields:
+        bytes: Consecutive pieces of the page
+    """
+    yield HTML_HEADER_BYTES
+    if page_name == "home":
+        yield b"<h2>Task Dashboard</h2>"
+        for fragment in iter_organized_tasks_html(get_all_tasks(), get_all_projects()):
+            yield fragment.encode('utf-8')
+    else:
+        yield get_page_body(page_name, **kwargs).encode('utf-8')
+    yield HTML_FOOTER_BYTES
+
+def get_page_body(page_name, **kwargs):
+    """Return the HTML between the shared header and footer for specified page"""
+    html = ""
     
     if page_name == "home":
         tasks = get_all_tasks()
@@ -2396,7 +2811,6 @@ def get_html_page(page_name, **kwargs):
     elif page_name == "prompt_analytics":
         html += generate_prompt_analytics()
     
-    html += HTML_FOOTER
     return html
 
 def add_feature(form_data):
@@ -2466,10 +2880,11 @@ def add_feature(form_data):
             json.dump(task, f, indent=2)
         
         # If this is a new task for an existing project, add it to the project's root_tasks
-        if project_id != 'new_project':
-            project_file = list(PROJECTS_DIR.glob(f"{project_id}/project.json"))
-            if project_file:
-                with open(project_file[0], 'r', encoding='utf-8') as f:
+        if project_id and os.path.basename(project_id) == project_id and project_id not in ('.', '..'):
+            # Projects live at a fixed path, so there is nothing to glob for
+            project_file = os.path.join(_PROJECTS_DIR_STR, project_id, "project.json")
+            if os.path.exists(project_file):
+                with open(project_file, 'r', encoding='utf-8') as f:
                     project = json.load(f)
                 
                 if "root_tasks" not in project:
@@ -2478,7 +2893,7 @@ def add_feature(form_data):
                 project["root_tasks"].append(task_id)
                 project["updated_at"] = datetime.datetime.now().isoformat()
                 
-                with open(project_file[0], 'w', encoding='utf-8') as f:
+                with open(project_file, 'w', encoding='utf-8') as f:
                     json.dump(project, f, indent=2)
         
         return task_id
@@ -2534,65 +2949,104 @@ def main():
     else:
         print("⚠ No OpenAI API key configured. Visit /api_key_settings to set one.")
     
+    if start_cache_watcher():
+        print("✓ Watching task and project files for changes")
+    
     # Define the request handler
     class TaskManagerHandler(http.server.SimpleHTTPRequestHandler):
+        # Keep connections open so a page and its static assets share one socket.
+        # Every response therefore carries a Content-Length or is chunked.
+        protocol_version = "HTTP/1.1"
+        # Send small writes (headers, page fragments) immediately instead of
+        # letting Nagle hold them back on a persistent connection
+        disable_nagle_algorithm = True
+        
+        def do_HEAD(self):
+            """
+            Handle HEAD requests with the headers of the matching GET.
+            
+            The page is still rendered, so a failing page fails its status
+            check too, but only the headers are sent. /trigger_agent is
+            refused because its GET starts agent processing.
+            """
+            if urllib.parse.urlparse(self.path).path == "/trigger_agent":
+                self.send_response(405)
+                self.send_header('Allow', 'GET')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.do_GET()
+        
         def do_GET(self):
             """Handle GET requests"""
+            begin_request_cache()
+            try:
+                self._handle_get()
+            finally:
+                end_request_cache()
+        
+        def do_POST(self):
+            """Handle POST requests"""
+            begin_request_cache()
+            try:
+                self._handle_post()
+            finally:
+                end_request_cache()
+        
+        def _handle_get(self):
+            """Route a GET request"""
             parsed_url = urllib.parse.urlparse(self.path)
             path = parsed_url.path
             query = urllib.parse.parse_qs(parsed_url.query)
             
             # Route to appropriate handlers
             if path == "/":
-                self._send_response(get_html_page("home"))
+                self._send_stream(iter_html_page("home"))
+            elif path in STATIC_FILES:
+                self._send_static(path)
             elif path == "/refresh":
-                self.send_response(302)  # Redirect
-                self.send_header('Location', '/')
-                self.end_headers()
+                self._redirect('/')
             elif path == "/feature_form":
-                self._send_response(get_html_page("feature_form"))
+                self._send_page("feature_form")
             elif path == "/feature_added":
                 task_id = query.get('task_id', [''])[0]
-                self._send_response(get_html_page("feature_added", task_id=task_id))
+                self._send_page("feature_added", task_id=task_id)
             elif path == "/view":
                 task_id = query.get('task_id', [''])[0]
-                self._send_response(get_html_page("view_task", task_id=task_id))
+                self._send_page("view_task", task_id=task_id)
             elif path == "/project":
                 project_id = query.get('project_id', [''])[0]
-                self._send_response(get_html_page("project", project_id=project_id))
+                self._send_page("project", project_id=project_id)
             elif path == "/agent_status":
-                self._send_response(get_html_page("agent_status"))
+                self._send_page("agent_status")
             elif path == "/trigger_agent":
                 task_id = query.get('task_id', [''])[0]
                 success = trigger_agent_processing(task_id)
                 if success:
-                    self._send_response(get_html_page("agent_triggered", task_id=task_id))
+                    self._send_page("agent_triggered", task_id=task_id)
                 else:
                     self._send_response(f"<p>Error triggering agent for task {task_id}</p>")
             elif path == "/kanban":
                 self._send_response("<h2>Kanban Board</h2><p>Kanban board feature coming soon!</p>")
             elif path == "/api_key_settings":
-                self._send_response(get_html_page("api_key_settings"))
+                self._send_page("api_key_settings")
             elif path == "/api_key_saved":
-                self._send_response(get_html_page("api_key_saved"))
+                self._send_page("api_key_saved")
             elif path == "/api_key_cleared":
-                self._send_response(get_html_page("api_key_cleared"))
+                self._send_page("api_key_cleared")
             elif path == "/feedback_dashboard":
-                self._send_response(get_html_page("feedback_dashboard"))
+                self._send_page("feedback_dashboard")
             elif path == "/peer_review_stats":
-                self._send_response(get_html_page("peer_review_stats"))
+                self._send_page("peer_review_stats")
             elif path == "/peer_review_console":
-                self._send_response(get_html_page("peer_review_console"))
+                self._send_page("peer_review_console")
             elif path == "/prompt_analytics":
-                self._send_response(get_html_page("prompt_analytics"))
+                self._send_page("prompt_analytics")
             else:
-                self.send_response(404)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write(b"404 - Not Found")
+                self._send_bytes(b"404 - Not Found", 404)
                 
-        def do_POST(self):
-            """Handle POST requests"""
+        def _handle_post(self):
+            """Route a POST request"""
             content_length = int(self.headers['Content-Length'])
             post_data = self.rfile.read(content_length).decode('utf-8')
             form_data = urllib.parse.parse_qs(post_data)
@@ -2606,9 +3060,7 @@ def main():
                 
                 if task_id:
                     # Redirect to a success page
-                    self.send_response(302)
-                    self.send_header('Location', '/feature_added?task_id=' + task_id)
-                    self.end_headers()
+                    self._redirect('/feature_added?task_id=' + task_id)
                 else:
                     # Show error message
                     self._send_response("Error adding feature")
@@ -2619,8 +3071,7 @@ def main():
                     self._send_response("No tasks selected for deletion", 400)
                 else:
                     # Show confirmation page instead of deleting directly
-                    response = get_html_page("bulk_delete_confirmation", selected_tasks=selected_tasks)
-                    self._send_response(response)
+                    self._send_page("bulk_delete_confirmation", selected_tasks=selected_tasks)
             elif self.path == "/confirm_delete":
                 # Handle confirmed deletion
                 confirm_tasks = form_data.get('confirm_tasks', [])
@@ -2631,9 +3082,7 @@ def main():
                     deleted_count = delete_tasks(confirm_tasks)
                     
                     # Redirect to a success page
-                    self.send_response(303)
-                    self.send_header('Location', f'/tasks_deleted?count={deleted_count}')
-                    self.end_headers()
+                    self._redirect(f'/tasks_deleted?count={deleted_count}', 303)
             elif self.path == "/add_subtask":
                 # Handle adding a subtask
                 parent_task_id = single_value_form_data.get('parent_task_id')
@@ -2655,9 +3104,7 @@ def main():
                     
                     if task_id:
                         # Redirect back to the parent task view
-                        self.send_response(303)
-                        self.send_header('Location', f'/view?task_id={parent_task_id}')
-                        self.end_headers()
+                        self._redirect(f'/view?task_id={parent_task_id}', 303)
                     else:
                         self._send_response("Failed to create subtask", 500)
             elif self.path == "/update_task":
@@ -2682,9 +3129,7 @@ def main():
                     success = update_task(task_id, updated_data)
                     if success:
                         # Redirect to the task view page
-                        self.send_response(303)
-                        self.send_header('Location', f'/view?task_id={task_id}')
-                        self.end_headers()
+                        self._redirect(f'/view?task_id={task_id}', 303)
                     else:
                         self._send_response("Failed to update task", 500)
             elif self.path == "/delete_task":
@@ -2697,9 +3142,7 @@ def main():
                     deleted = delete_tasks([task_id])
                     
                     # Redirect to dashboard
-                    self.send_response(303)
-                    self.send_header('Location', '/')
-                    self.end_headers()
+                    self._redirect('/', 303)
             elif self.path == "/save_api_key":
                 # Handle API key saving
                 api_key = single_value_form_data.get('api_key', '').strip()
@@ -2711,9 +3154,7 @@ def main():
                     success = secure_config.save_api_key(api_key)
                     if success:
                         # Redirect to success page
-                        self.send_response(302)
-                        self.send_header('Location', '/api_key_saved')
-                        self.end_headers()
+                        self._redirect('/api_key_saved')
                     else:
                         self._send_response("Failed to save API key", 500)
             elif self.path == "/clear_api_key":
@@ -2721,30 +3162,95 @@ def main():
                 success = secure_config.clear_api_key()
                 if success:
                     # Redirect to cleared page
-                    self.send_response(302)
-                    self.send_header('Location', '/api_key_cleared')
-                    self.end_headers()
+                    self._redirect('/api_key_cleared')
                 else:
                     self._send_response("Failed to clear API key", 500)
             else:
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write(b"Form received")
+                self._send_bytes(b"Form received")
         
-        def _send_response(self, content):
+        def _send_response(self, content, status=200):
             """Send a standard HTML response"""
+            self._send_bytes(content.encode('utf-8'), status)
+            
+        def _send_bytes(self, body, status=200):
+            """Send an encoded HTML body with its length"""
+            self.send_response(status)
+            self.send_header('Content-type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if self.command != 'HEAD':
+                self.wfile.write(body)
+            
+        def _send_static(self, path):
+            """Send a file from STATIC_FILES with a long browser cache lifetime"""
+            body, content_type = STATIC_FILES[path]
+            self.send_response(200)
+            self.send_header('Content-type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'public, max-age=86400')
+            self.end_headers()
+            if self.command != 'HEAD':
+                self.wfile.write(body)
+            
+        def _redirect(self, location, status=302):
+            """Redirect to another page with an empty body"""
+            self.send_response(status)
+            self.send_header('Location', location)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            
+        def _send_stream(self, chunks):
+            """
+            Send an HTML page as it is generated.
+            
+            HTTP/1.1 responses use chunked transfer encoding; HTTP/1.0 responses
+            are delimited by closing the connection. HEAD responses render the
+            whole page to report its length and send no body.
+            """
+            if self.command == 'HEAD':
+                self._send_bytes(b"".join(chunks))
+                return
+            chunked = self.protocol_version >= "HTTP/1.1" and self.request_version != "HTTP/1.0"
+            self.send_response(200)
+            self.send_header('Content-type', 'text/html; charset=utf-8')
+            if chunked:
+                self.send_header('Transfer-Encoding', 'chunked')
+            else:
+                self.close_connection = True
+            self.end_headers()
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                if chunked:
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                else:
+                    self.wfile.write(chunk)
+            if chunked:
+                self.wfile.write(b"0\r\n\r\n")
+            
+        def _send_page(self, page_name, **kwargs):
+            """Send a full page, writing the pre-encoded header and footer around its body"""
+            body = get_page_body(page_name, **kwargs).encode('utf-8')
             self.send_response(200)
-            self.send_header('Content-type', 'text/html')
+            self.send_header('Content-type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(HTML_HEADER_BYTES) + len(body) + len(HTML_FOOTER_BYTES)))
             self.end_headers()
-            self.wfile.write(content.encode())
+            if self.command != 'HEAD':
+                self.wfile.write(HTML_HEADER_BYTES)
+                self.wfile.write(body)
+                self.wfile.write(HTML_FOOTER_BYTES)
             
     # Set up the HTTP server
     port = PORT
     handler = TaskManagerHandler
     
+    # One daemon thread per request so a slow page does not block other tabs;
+    # Stop on SIGTERM the same way as on Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    
+    # HTTPServer already sets allow_reuse_address for quick restarts
     try:
-        with socketserver.TCPServer(("", port), handler) as httpd:
+        with http.server.ThreadingHTTPServer(("", port), handler) as httpd:
             print(f"Server started at http://localhost:{port}")
             print("Opening browser...")
             webbrowser.open(f"http://localhost:{port}")
@@ -2753,6 +3259,9 @@ def main():
         print("\nShutting down server...")
     except Exception as e:
         print(f"Error starting server: {str(e)}")
+    finally:
+        # Drop triggers still waiting for a worker instead of delaying exit
+        _agent_pool.shutdown(wait=False, cancel_futures=True)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file